@@ -2,271 +2,643 @@
 Interface interativa com InquirerPy.
 """
 
-from pathlib import Path
-from typing import Optional
+import functools
+import os
+import re
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 from InquirerPy.separator import Separator
 
-from ..database.models import DatabaseManager
+from ..database.models import DatabaseManager, OrphanRecord, Repository
 from ..core.activity_monitor import DevPeaceActivityMonitor
+from ..core.status_manager import StatusManager, event_title
+from ..core.status_mapping import map_statuses
 from ..config.settings import ConfigManager
-from ..jira_integration.client import JiraClient
+
+if TYPE_CHECKING:
+    from ..jira_integration.client import JiraClient
+
+# Quantidade de issues exibidas em "Buscar minhas issues"
+_MY_ISSUES_LIMIT = 10
+
+# Tempo (em segundos) que a lista de repositórios fica em cache; o monitor e
+# outros comandos também alteram o banco (ex.: última atividade)
+_REPO_CACHE_TTL = 30
+
+# Tempo máximo (em segundos) de espera pela conexão com o Jira aberta na inicialização
+_JIRA_CONNECT_TIMEOUT = 10
+
+# A partir deste tamanho, listas de seleção viram busca fuzzy (filtra ao digitar)
+_FUZZY_MIN_CHOICES = 15
+
+# Chaves de configuração cujo valor não deve ser exibido
+_SECRET_KEY_RE = re.compile(r'token|password', re.IGNORECASE)
+
+# Máscara de tamanho fixo, para não revelar o tamanho do segredo
+_SECRET_MASK = '********'
+
+# Chave de issue do Jira (ex: PROJ-123)
+_ISSUE_KEY_RE = re.compile(r'[A-Za-z][A-Za-z0-9_]*-\d+')
+
+
+# Valor da opção "digitar manualmente" nas listas de status; uma string, pois o
+# InquirerPy copia os valores das opções (comparar com ==, nunca com is)
+_CUSTOM_STATUS = '__custom_status__'
+
+# Valor da opção "cancelar"; não é None para não coincidir com default=None
+# e deixar o cancelamento pré-selecionado
+_CANCEL_STATUS = '__cancel_status__'
+
+
+def _is_nonempty(value: str) -> bool:
+    """Valida que o texto digitado não está vazio."""
+    return len(value) > 0
+
+
+def _is_directory(value: str) -> bool:
+    """Valida que o caminho digitado é um diretório existente."""
+    return bool(value) and os.path.isdir(value)
+
+
+def _is_issue_key(value: str) -> bool:
+    """Valida que o texto digitado é uma chave de issue."""
+    return _ISSUE_KEY_RE.fullmatch(value) is not None
+
+
+def _require_jira(method: Callable) -> Callable:
+    """Só executa o método se o Jira estiver conectado; senão avisa e volta ao menu."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._jira_is_connected():
+            self._pause("\nJira não está conectado")
+            return None
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+# Banner exibido na abertura da interface, já codificado
+_BANNER: bytes = (r'''
+  _____                             _.-.                   _____                    
+ |  __ \                        .-.  `) |  .-.            |  __ \                   
+ | |  | | _____   __        _.'`. .~./  \.~. .`'._        | |__) |__  __ _  ___ ___ 
+ | |  | |/ _ \ \ / /    .-'`.'-'.'.-:    ;-.'.'-'.`'-.    |  ___/ _ \/ _` |/ __/ _ \
+ | |__| |  __/\ V /      `'`'`'`'`   \  /   `'`'`'`'`     | |  |  __/ (_| | (_|  __/
+ |_____/ \___| \_/                   /||\                 |_|   \___|\__,_|\___\___|
+                          jgs       / ^^ \                                       
+                                    `'``'`
+''' + (
+    "\nBem-vindo à interface interativa do Dev Peace!\n"
+    "Use as setas para navegar e Enter para selecionar\n\n"
+)).encode('utf-8')
 
 
 class InteractiveInterface:
     """Interface interativa bonita para o Dev Peace."""
+
+    # Menus estáticos, montados uma única vez na importação
+    _MAIN_MENU_CHOICES = [
+        Choice("status",       "[Status]   Ver Status"),
+        Choice("repositories", "[Repos]    Gerenciar Repositórios"),
+        Choice("monitoring",   "[Monitor]  Controlar Monitoramento"),
+        Choice("orphans",      "[Orphans]  Registros Órfãos"),
+        Choice("jira",         "[Jira]     Integração Jira"),
+        Choice("config",       "[Config]   Configurações"),
+        Separator(),
+        Choice("exit",         "[Sair]     Sair")
+    ]
+
+    _REPO_MENU_CHOICES = [
+        Choice("list",   "[Listar]  Listar repositórios"),
+        Choice("add",    "[Add]     Adicionar repositório"),
+        Choice("toggle", "[Toggle]  Ativar/Desativar repositório"),
+        Separator(),
+        Choice("back",   "[Voltar]  Voltar")
+    ]
+
+    _ORPHAN_ACTION_CHOICES = [
+        Choice("list",   "[Listar]  Listar todos"),
+        Choice("assign", "[Link]    Associar issue manualmente"),
+        Choice("delete", "[Del]     Excluir órfão"),
+        Separator(),
+        Choice("back",   "[Voltar]  Voltar")
+    ]
+
+    _CONFIG_MENU_CHOICES = [
+        Choice("show", "[Ver]     Ver configurações"),
+        Choice("jira", "[Jira]    Configurar Jira"),
+        Separator(),
+        Choice("back", "[Voltar]  Voltar")
+    ]
+
+    _MONITOR_RUNNING_CHOICES = [
+        Choice("stop",   "[Stop]    Parar monitoramento"),
+        Choice("status", "[Status]  Ver status"),
+        Separator(),
+        Choice("back",   "[Voltar]  Voltar")
+    ]
+
+    _MONITOR_STOPPED_CHOICES = [
+        Choice("start",          "[Start]     Iniciar monitoramento"),
+        Choice("start_specific", "[Caminhos]  Monitorar caminhos específicos"),
+        Separator(),
+        Choice("back",           "[Voltar]    Voltar")
+    ]
+
+    _JIRA_MENU_CHOICES = [
+        Choice("test",       "[Test]      Testar conexão"),
+        Choice("projects",   "[Projetos]  Ver projetos disponíveis"),
+        Choice("status",     "[Status]    Descobrir status de projeto"),
+        Choice("workflow",   "[Workflow]  Analisar workflow de issue"),
+        Choice("automation", "[Auto]      Configurar automação de status"),
+        Separator(),
+        Choice("issues",     "[Issues]    Buscar minhas issues"),
+        Choice("worklog",    "[Worklog]   Criar worklog de teste"),
+        Choice("config",     "[Config]    Configurar credenciais"),
+        Separator(),
+        Choice("back",       "[Voltar]    Voltar")
+    ]
+
+    _AUTOMATION_MENU_CHOICES = [
+        Choice("show",      "[Ver]     Ver regras atuais"),
+        Choice("enable",    "[ON]      Habilitar automação"),
+        Choice("disable",   "[OFF]     Desabilitar automação"),
+        Choice("configure", "[Config]  Configurar baseado no Jira"),
+        Choice("rules",     "[Regras]  Gerenciar regras individuais"),
+        Choice("reset",     "[Reset]   Resetar para padrões"),
+        Separator(),
+        Choice("back",      "[Voltar]  Voltar")
+    ]
+
+    _DISCOVERY_METHOD_CHOICES = [
+        Choice("project", "[Projeto] Por projeto"),
+        Choice("issue", "[Issue] Por issue específica"),
+        Choice("back", "[Voltar] Voltar")
+    ]
+
+    _MAPPING_ACTION_CHOICES = [
+        Choice("auto", "[Auto] Aplicar configuração automática"),
+        Choice("edit", "[Edit] Editar configuração antes de aplicar"),
+        Choice("manual", "[Manual] Configurar tudo manualmente"),
+        Choice("cancel", "[Cancel] Cancelar")
+    ]
+
+    _EVENT_CHOICES = [
+        Choice("on_work_start",    "[Start]     Início de Trabalho"),
+        Choice("on_first_commit",  "[Commit]    Primeiro Commit"),
+        Choice("on_work_complete", "[Complete]  Finalização de Trabalho"),
+        Separator(),
+    ]
+
+    _MANUAL_CONFIG_EVENT_CHOICES = [
+        *_EVENT_CHOICES,
+        Choice("done", "[OK]        Finalizar configuração")
+    ]
+
+    _RULES_EVENT_CHOICES = [
+        *_EVENT_CHOICES,
+        Choice("back", "[Voltar]    Voltar")
+    ]
+
+    # Eventos editáveis: (evento, rótulo, categoria padrão de origem, categoria padrão de destino)
+    _EDIT_EVENT_RULES = (
+        ("on_work_start",    "Início de Trabalho",      "todo",        "in_progress"),
+        ("on_first_commit",  "Primeiro Commit",         "todo",        "in_progress"),
+        ("on_work_complete", "Finalização de Trabalho", "in_progress", "done"),
+    )
+
+    _EDIT_EVENT_CHOICES = [
+        Choice("on_work_start",    "Início de Trabalho", enabled=True),
+        Choice("on_first_commit",  "Primeiro Commit"),
+        Choice("on_work_complete", "Finalização de Trabalho"),
+    ]
+
+    _TRANSITION_ACTION_CHOICES = [
+        Choice("add",  "[Add]      Adicionar nova transição"),
+        Choice("back", "[Voltar]   Voltar")
+    ]
+    # Depois da lista de transições existentes
+    _TRANSITION_ACTION_TAIL = [Separator(), *_TRANSITION_ACTION_CHOICES]
+
+    _CUSTOM_STATUS_CHOICE = Choice(_CUSTOM_STATUS, "[Manual]  Digitar manualmente...")
+    _CANCEL_STATUS_CHOICE = Choice(_CANCEL_STATUS, "[X] Não configurar / Cancelar")
+    # Finais das listas de status (o prompt fuzzy não aceita Separator)
+    _STATUS_SELECT_TAIL = [Separator(), _CUSTOM_STATUS_CHOICE, _CANCEL_STATUS_CHOICE]
+    _STATUS_FUZZY_TAIL = [_CUSTOM_STATUS_CHOICE, _CANCEL_STATUS_CHOICE]
+    _MANUAL_PROJECT_CHOICE = Choice("manual", "[Manual] Digitar chave manualmente")
+    _GLOBAL_STATUSES_CHOICE = Choice("all", "[Global]  Todos os Status (Global)")
     
     def __init__(self, db: DatabaseManager, monitor: DevPeaceActivityMonitor, config: ConfigManager):
         self.db = db
         self.monitor = monitor
         self.config = config
-        self.jira_client: Optional[JiraClient] = None
+        self.jira_client: Optional["JiraClient"] = None
+
+        # Cache das consultas ao banco, invalidado por versão a cada mutação
+        self._repo_cache: Optional[List[Repository]] = None
+        self._repo_cache_version = -1
+        self._repo_cache_time = 0.0
+        self._repo_version = 0
+        self._repo_choices: Optional[List[Choice]] = None
+        self._repos_by_id: Dict[int, Repository] = {}
+        self._orphan_cache: Optional[List[OrphanRecord]] = None
+        self._orphan_cache_version: Optional[tuple] = None
+        self._orphan_version = 0
+        self._orphan_choices: Optional[List[Choice]] = None
+        # Linhas de "Ver configurações" por versão da configuração
+        self._config_view_cache: Optional[Tuple[int, List[str]]] = None
+        # Opções de projeto montadas para a última lista de projetos recebida
+        self._project_choices_cache: Optional[Tuple[List[Dict[str, Any]], List[Choice]]] = None
+        # Opções de status montadas para a última lista de status exibida
+        self._status_choices_cache: Optional[Tuple[List[str], List[Choice]]] = None
+
+        # Buscas do Jira adiantadas em segundo plano enquanto o usuário navega
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jira_connect_future: Optional[Future] = None
+        # Regras de automação carregadas uma vez e compartilhadas pelas telas
+        self._status_manager: Optional[StatusManager] = None
+        self._projects_future: Optional[Future] = None
+        self._my_issues_future: Optional[Future] = None
+        self._all_statuses_future: Optional[Future] = None
+
+        # Mapeia opções do menu principal para handlers
+        self._main_actions: Dict[str, Callable[[], None]] = {
+            'status': self._show_status,
+            'repositories': self._manage_repositories,
+            'orphans': self._manage_orphans,
+            'config': self._manage_config,
+            'monitoring': self._manage_monitoring,
+            'jira': self._manage_jira,
+        }
     
+    def _write_banner(self):
+        """Escreve o banner de uma vez só, direto no buffer binário do terminal."""
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            # stdout redirecionado para um objeto só de texto
+            sys.stdout.write(_BANNER.decode('utf-8'))
+            return
+        sys.stdout.flush()
+        buffer.write(_BANNER)
+        buffer.flush()
+
     def run(self) -> int:
         """Executa a interface interativa."""
-        print(r'''
-  _____                             _.-.                   _____                    
- |  __ \                        .-.  `) |  .-.            |  __ \                   
- | |  | | _____   __        _.'`. .~./  \.~. .`'._        | |__) |__  __ _  ___ ___ 
- | |  | |/ _ \ \ / /    .-'`.'-'.'.-:    ;-.'.'-'.`'-.    |  ___/ _ \/ _` |/ __/ _ \
- | |__| |  __/\ V /      `'`'`'`'`   \  /   `'`'`'`'`     | |  |  __/ (_| | (_|  __/
- |_____/ \___| \_/                   /||\                 |_|   \___|\__,_|\___\___|
-                          jgs       / ^^ \                                       
-                                    `'``'`
-''')
-        print("Bem-vindo à interface interativa do Dev Peace!")
-        print("Use as setas para navegar e Enter para selecionar\n")
-        
-        while True:
-            try:
-                choice = self._show_main_menu()
-                
-                if choice == 'exit':
-                    print("Até logo! Que a paz esteja com seu código!")
+        # Conecta ao Jira enquanto o usuário ainda está no menu principal
+        if self.config.is_jira_configured():
+            self._jira_connect_future = self._submit(self._connect_jira_background)
+
+        try:
+            self._write_banner()
+
+            while True:
+                try:
+                    choice = self._show_main_menu()
+
+                    if choice == 'exit':
+                        print("Até logo! Que a paz esteja com seu código!")
+                        return 0
+
+                    handler = self._main_actions.get(choice)
+                    if handler:
+                        handler()
+
+                except KeyboardInterrupt:
+                    print("\nAté logo!")
                     return 0
-                elif choice == 'status':
-                    self._show_status()
-                elif choice == 'repositories':
-                    self._manage_repositories()
-                elif choice == 'orphans':
-                    self._manage_orphans()
-                elif choice == 'config':
-                    self._manage_config()
-                elif choice == 'monitoring':
-                    self._manage_monitoring()
-                elif choice == 'jira':
-                    self._manage_jira()
-                
-            except KeyboardInterrupt:
-                print("\nAté logo!")
-                return 0
-            except Exception as e:
-                print(f"\nErro inesperado: {e}")
-                input("Pressione Enter para continuar...")
+                except Exception as e:
+                    self._pause(f"\nErro inesperado: {e}")
+        finally:
+            # Qualquer saída (inclusive exceções que escapam) descarta as buscas pendentes
+            self._shutdown_executor()
     
+    def _submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Agenda uma busca em segundo plano."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dev-peace")
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def _shutdown_executor(self):
+        """Descarta buscas pendentes ao sair da interface."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _take_prefetched(self, attr: str, fetch: Callable[[], Any]) -> Any:
+        """Consome o resultado adiantado em `attr` ou busca de forma síncrona."""
+        future = getattr(self, attr)
+        setattr(self, attr, None)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                pass
+        return fetch()
+
+    def _get_status_manager(self) -> StatusManager:
+        """Retorna o StatusManager da sessão, com o cliente Jira atual."""
+        if self._status_manager is None:
+            self._status_manager = StatusManager(self.config, self.jira_client)
+        else:
+            self._status_manager.jira_client = self.jira_client
+        return self._status_manager
+
+    def _jira_is_connected(self) -> bool:
+        """Indica se há um cliente Jira autenticado (só consulta o estado local, sem rede)."""
+        return self.jira_client is not None and self.jira_client.is_connected()
+
+    def _connect_jira_background(self) -> Optional["JiraClient"]:
+        """Conecta ao Jira com as credenciais salvas; roda em segundo plano."""
+        client = self._jira_client_for_config()
+        return client if client.connect() else None
+
+    def _await_jira_connection(self):
+        """Adota o cliente conectado na inicialização, esperando no máximo alguns segundos."""
+        future = self._jira_connect_future
+        if future is None:
+            return
+
+        if not future.done():
+            print("\nConectando ao Jira...")
+        try:
+            client = future.result(timeout=_JIRA_CONNECT_TIMEOUT)
+        except TimeoutError:
+            # Continua em segundo plano; tenta de novo na próxima visita ao menu
+            return
+        except Exception:
+            client = None
+
+        self._jira_connect_future = None
+        if client is not None and self.jira_client is None:
+            self.jira_client = client
+
+    def _invalidate_jira_cache(self):
+        """Descarta buscas adiantadas do Jira."""
+        self._projects_future = None
+        self._my_issues_future = None
+        self._all_statuses_future = None
+
+    def _get_projects(self) -> List[Dict[str, Any]]:
+        """Lista projetos do Jira, usando a busca adiantada se houver."""
+        # O próprio JiraClient mantém projetos e status em cache por alguns minutos
+        return self._take_prefetched('_projects_future', self.jira_client.get_projects)
+
+    def _project_choices(self, projects: List[Dict[str, Any]]) -> List[Choice]:
+        """Retorna as opções de seleção dos projetos, reaproveitadas enquanto a lista for a mesma."""
+        # O JiraClient devolve a mesma lista enquanto ela estiver em cache
+        if self._project_choices_cache is None or self._project_choices_cache[0] is not projects:
+            choices = [Choice(p['key'], f"{p['key']} - {p['name']}") for p in projects]
+            self._project_choices_cache = (projects, choices)
+        return self._project_choices_cache[1]
+
+    def _select_choice(self, message: str, choices: List[Choice]) -> Any:
+        """Seleciona uma opção; listas grandes usam busca fuzzy em vez de rolagem."""
+        if len(choices) > _FUZZY_MIN_CHOICES:
+            return inquirer.fuzzy(message=message, choices=choices).execute()
+        return inquirer.select(message=message, choices=choices).execute()
+
+    def _prefetch_all_statuses(self):
+        """Adianta a busca dos status globais, se ainda não houver uma em andamento."""
+        if self._all_statuses_future is None and self._jira_is_connected():
+            self._all_statuses_future = self._submit(self.jira_client.get_all_statuses)
+
+    def _get_project_statuses(self, project_key: str) -> List[str]:
+        """Busca os status do projeto, aproveitando a busca adiantada durante a seleção."""
+        # A busca adiantada preenche o cache do JiraClient, que também atende os projetos
+        future, self._all_statuses_future = self._all_statuses_future, None
+        if future is not None:
+            wait([future])
+        return self.jira_client.get_project_statuses(project_key)
+
+    def _prefetch_jira_data(self):
+        """Adianta as buscas de projetos e issues enquanto o usuário escolhe no menu."""
+        if not self._jira_is_connected():
+            return
+
+        if self._projects_future is None:
+            self._projects_future = self._submit(self.jira_client.get_projects)
+        if self._my_issues_future is None:
+            self._my_issues_future = self._submit(
+                self.jira_client.get_my_issues, max_results=_MY_ISSUES_LIMIT
+            )
+
     def _show_main_menu(self) -> str:
         """Mostra o menu principal."""
-        choices = [
-            Choice("status",       "[Status]   Ver Status"),
-            Choice("repositories", "[Repos]    Gerenciar Repositórios"),
-            Choice("monitoring",   "[Monitor]  Controlar Monitoramento"),
-            Choice("orphans",      "[Orphans]  Registros Órfãos"),
-            Choice("jira",         "[Jira]     Integração Jira"),
-            Choice("config",       "[Config]   Configurações"),
-            Separator(),
-            Choice("exit",         "[Sair]     Sair")
-        ]
-        
         return inquirer.select(
             message="O que você gostaria de fazer?",
-            choices=choices,
+            choices=self._MAIN_MENU_CHOICES,
             default="status"
         ).execute()
     
     def _show_status(self):
         """Mostra status detalhado."""
-        stats = self.monitor.get_repository_stats()
+        snapshot = self.monitor.get_status_snapshot()
+        stats = snapshot.stats
         
-        print("\nStatus do Dev Peace")
-        print("=" * 40)
-        print(f"Status: {'[Rodando]' if stats['is_running'] else '[Parado]'}")
-        print(f"Repositórios: {stats['total_repositories']} total, {stats['active_repositories']} ativos")
-        print(f"Sessões ativas: {stats['active_sessions']}")
-        print(f"Registros órfãos: {stats['orphan_records']}")
-        print(f"Caminhos monitorados: {stats['monitored_paths']}")
+        lines = [
+            "\nStatus do Dev Peace",
+            "=" * 40,
+            f"Status: {'[Rodando]' if stats['is_running'] else '[Parado]'}",
+            f"Repositórios: {stats['total_repositories']} total, {stats['active_repositories']} ativos",
+            f"Sessões ativas: {stats['active_sessions']}",
+            f"Registros órfãos: {stats['orphan_records']}",
+            f"Caminhos monitorados: {stats['monitored_paths']}",
+        ]
         
         # Sessões ativas
-        active_sessions = self.monitor.get_active_sessions()
-        if active_sessions:
-            print("\nSessões ativas:")
-            for session in active_sessions:
+        if snapshot.active_sessions:
+            lines.append("\nSessões ativas:")
+            for session in snapshot.active_sessions:
                 issue_info = f" ({session.jira_issue})" if session.jira_issue else " (sem issue)"
-                print(f"  * {session.branch_name}{issue_info}")
-        
-        input("\nPressione Enter para continuar...")
+                lines.append(f"  * {session.branch_name}{issue_info}")
+        self._pause(*lines, "", prefetch=self._get_repositories_cached)
     
+    def _get_repositories_cached(self) -> List[Repository]:
+        """Retorna repositórios, reaproveitando a última consulta recente se nada mudou."""
+        if (self._repo_cache is None or self._repo_cache_version != self._repo_version
+                or time.monotonic() - self._repo_cache_time >= _REPO_CACHE_TTL):
+            self._repo_cache = self.db.get_all_repositories()
+            self._repo_cache_version = self._repo_version
+            self._repo_cache_time = time.monotonic()
+            self._repo_choices = None
+        return self._repo_cache
+
+    def _get_orphans_cached(self) -> List[OrphanRecord]:
+        """Retorna registros órfãos, reaproveitando a última consulta se nada mudou."""
+        # Órfãos também são criados pelo monitor, então a versão local não basta
+        version = (self._orphan_version, self.db.get_orphan_records_signature())
+        if self._orphan_cache is None or self._orphan_cache_version != version:
+            self._orphan_cache = self.db.get_orphan_records()
+            self._orphan_cache_version = version
+            self._orphan_choices = None
+        return self._orphan_cache
+
+    def _get_orphan_choices(self) -> List[Choice]:
+        """Retorna as opções de seleção dos órfãos em cache, montadas uma única vez."""
+        orphans = self._get_orphans_cached()
+        if self._orphan_choices is None:
+            self._orphan_choices = [
+                Choice(
+                    orphan.id,
+                    f"Branch: {orphan.branch_name} ({orphan.total_minutes}min, {orphan.activities_count} atividades)"
+                )
+                for orphan in orphans
+            ]
+        return self._orphan_choices
+
+    def _write_lines(self, lines: List[str]):
+        """Escreve várias linhas no terminal com uma única chamada."""
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _pause(self, *lines: str, prefetch: Optional[Callable[[], Any]] = None):
+        """Exibe as linhas junto com o aviso de pausa numa única escrita e aguarda Enter."""
+        # `prefetch` carrega os dados da próxima tela enquanto o usuário lê esta
+        future = self._submit(prefetch) if prefetch else None
+        input("\n".join((*lines, "Pressione Enter para continuar...")))
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                # A próxima tela consulta o banco normalmente
+                pass
+
     def _manage_repositories(self):
         """Gerencia repositórios."""
+        handlers = {
+            'list': self._list_repositories,
+            'add': self._add_repository,
+            'toggle': self._toggle_repository,
+        }
+
         while True:
             action = inquirer.select(
                 message="Gerenciar repositórios:",
-                choices=[
-                    Choice("list",   "[Listar]  Listar repositórios"),
-                    Choice("add",    "[Add]     Adicionar repositório"),
-                    Choice("toggle", "[Toggle]  Ativar/Desativar repositório"),
-                    Separator(),
-                    Choice("back",   "[Voltar]  Voltar")
-                ]
+                choices=self._REPO_MENU_CHOICES
             ).execute()
             
             if action == "back":
                 break
-            elif action == "list":
-                self._list_repositories()
-            elif action == "add":
-                self._add_repository()
-            elif action == "toggle":
-                self._toggle_repository()
+
+            handler = handlers.get(action)
+            if handler:
+                handler()
     
     def _list_repositories(self):
         """Lista repositórios."""
-        repositories = self.db.get_all_repositories()
+        repositories = self._get_repositories_cached()
         
         if not repositories:
-            print("\nNenhum repositório encontrado")
-            input("Pressione Enter para continuar...")
+            self._pause("\nNenhum repositório encontrado")
             return
         
-        print("\nRepositórios monitorados:")
-        print("=" * 50)
-        
+        lines = ["\nRepositórios monitorados:", "=" * 50]
         for repo in repositories:
             status = "[Ativo]" if repo.is_active else "[Inativo]"
-            print(f"\n{status} - {repo.name}")
-            print(f"Local: {repo.path}")
+            lines.append(f"\n{status} - {repo.name}")
+            lines.append(f"Local: {repo.path}")
             if repo.last_activity:
-                print(f"Ultima atividade: {repo.last_activity}")
-        
-        input("\nPressione Enter para continuar...")
+                lines.append(f"Ultima atividade: {repo.last_activity}")
+        self._pause(*lines, "", prefetch=self._get_orphans_cached)
     
     def _add_repository(self):
         """Adiciona repositório."""
         path = inquirer.filepath(
             message="Selecione o caminho do repositório:",
-            validate=lambda x: Path(x).is_dir() if x else False,
+            validate=_is_directory,
             invalid_message="Por favor, selecione um diretório válido"
         ).execute()
 
         if path:
             print(f"\nAdicionando repositório: {path}")
             if self.monitor.add_repository(str(path)):
+                self._repo_version += 1
                 print("Repositório adicionado com sucesso!")
             else:
                 print("Erro ao adicionar repositório")
 
-            input("Pressione Enter para continuar...")
+            self._pause(prefetch=self._get_repositories_cached)
     
     def _toggle_repository(self):
         """Ativa/desativa repositório."""
-        repositories = self.db.get_all_repositories()
+        repositories = self._get_repositories_cached()
 
         if not repositories:
-            print("\nNenhum repositório encontrado")
-            input("Pressione Enter para continuar...")
+            self._pause("\nNenhum repositório encontrado")
             return
 
-        choices = []
-        for repo in repositories:
-            status = "[+]" if repo.is_active else "[-]"
-            choices.append(Choice(repo.id, f"{status} {repo.name}"))
-
-        repo_id = inquirer.select(
-            message="Selecione o repositório:",
-            choices=choices
-        ).execute()
-
-        # Busca repositório e alterna status
-        repo = self.db.get_repository_by_id(repo_id)
-        if repo:
-            if self.db.toggle_repository_status(repo_id):
-                new_status = "ativado" if not repo.is_active else "desativado"
-                print(f"\nRepositório {repo.name} foi {new_status}!")
-            else:
-                print(f"\nErro ao alterar status do repositório {repo.name}")
+        # Opções montadas uma vez por consulta ao banco
+        if self._repo_choices is None:
+            self._repo_choices = [
+                Choice(repo.id, f"{'[+]' if repo.is_active else '[-]'} {repo.name}")
+                for repo in repositories
+            ]
+            self._repos_by_id = {repo.id: repo for repo in repositories}
+
+        # O valor da opção é o id: o InquirerPy converte valores dataclass em dict
+        repo_id = self._select_choice("Selecione o repositório:", self._repo_choices)
+        repo = self._repos_by_id[repo_id]
+
+        # Alterna status; o nome vem da lista já carregada
+        is_active = self.db.toggle_repository_status(repo_id)
+        if is_active is not None:
+            self._repo_version += 1
+            new_status = "ativado" if is_active else "desativado"
+            print(f"\nRepositório {repo.name} foi {new_status}!")
         else:
             print("\nRepositório não encontrado")
 
-        input("Pressione Enter para continuar...")
+        self._pause(prefetch=self._get_repositories_cached)
     
     def _manage_orphans(self):
         """Gerencia registros órfãos."""
-        orphans = self.db.get_orphan_records()
+        orphans = self._get_orphans_cached()
         
         if not orphans:
-            print("\nNenhum registro órfão! Tudo organizado!")
-            input("Pressione Enter para continuar...")
+            self._pause("\nNenhum registro órfão! Tudo organizado!")
             return
         
         print(f"\nEncontrados {len(orphans)} registros órfãos")
         
         action = inquirer.select(
             message="O que fazer com os órfãos?",
-            choices=[
-                Choice("list",   "[Listar]  Listar todos"),
-                Choice("assign", "[Link]    Associar issue manualmente"),
-                Choice("delete", "[Del]     Excluir órfão"),
-                Separator(),
-                Choice("back",   "[Voltar]  Voltar")
-            ]
+            choices=self._ORPHAN_ACTION_CHOICES
         ).execute()
         
-        if action == "back":
-            return
-        elif action == "list":
-            self._list_orphans(orphans)
-        elif action == "assign":
-            self._assign_orphan_issue(orphans)
-        elif action == "delete":
-            self._delete_orphan(orphans)
+        match action:
+            case "list":
+                self._list_orphans(orphans)
+            case "assign":
+                self._assign_orphan_issue(self._get_orphan_choices())
+            case "delete":
+                self._delete_orphan(self._get_orphan_choices())
     
     def _list_orphans(self, orphans):
         """Lista registros órfãos."""
-        print("\nRegistros órfãos:")
-        print("=" * 40)
-        
+        lines = ["\nRegistros órfãos:", "=" * 40]
         for i, orphan in enumerate(orphans, 1):
-            print(f"\n{i}. Branch: {orphan.branch_name}")
-            print(f"   Tempo: {orphan.total_minutes} minutos")
-            print(f"   Atividades: {orphan.activities_count}")
-            print(f"   Criado: {orphan.created_at}")
-        
-        input("\nPressione Enter para continuar...")
+            lines.append(f"\n{i}. Branch: {orphan.branch_name}")
+            lines.append(f"   Tempo: {orphan.total_minutes} minutos")
+            lines.append(f"   Atividades: {orphan.activities_count}")
+            lines.append(f"   Criado: {orphan.created_at}")
+        self._pause(*lines, "")
     
-    def _assign_orphan_issue(self, orphans):
+    def _assign_orphan_issue(self, orphan_choices: List[Choice]):
         """Associa issue a um órfão."""
-        choices = []
-        for orphan in orphans:
-            choices.append(Choice(
-                orphan.id,
-                f"Branch: {orphan.branch_name} ({orphan.total_minutes}min, {orphan.activities_count} atividades)"
-            ))
-
-        orphan_id = inquirer.select(
-            message="Selecione o registro órfão:",
-            choices=choices
-        ).execute()
+        orphan_id = self._select_choice("Selecione o registro órfão:", orphan_choices)
 
         issue_key = inquirer.text(
             message="Digite a issue do Jira (ex: PROJ-123):",
-            validate=lambda x: len(x) > 0,
+            validate=_is_nonempty,
             invalid_message="Issue não pode estar vazia"
         ).execute()
 
         print(f"\nAssociando issue {issue_key} ao registro órfão...")
 
         # Testa se a issue existe no Jira (se configurado)
-        if self.jira_client and self.jira_client.is_connected():
+        if self._jira_is_connected():
             if not self.jira_client.issue_exists(issue_key):
                 print(f"Aviso: Issue {issue_key} não encontrada no Jira")
                 if not inquirer.confirm("Continuar mesmo assim?", default=False).execute():
@@ -274,72 +646,62 @@ class InteractiveInterface:
 
         # Associa a issue
         if self.db.assign_orphan_issue(orphan_id, issue_key):
+            self._orphan_version += 1
             print("Issue associada com sucesso!")
         else:
             print("Erro ao associar issue")
 
-        input("Pressione Enter para continuar...")
+        self._pause()
     
-    def _delete_orphan(self, orphans):
+    def _delete_orphan(self, orphan_choices: List[Choice]):
         """Exclui um órfão."""
-        choices = []
-        for orphan in orphans:
-            choices.append(Choice(
-                orphan.id,
-                f"Branch: {orphan.branch_name} ({orphan.total_minutes}min, {orphan.activities_count} atividades)"
-            ))
-
-        orphan_id = inquirer.select(
-            message="Selecione o registro órfão para excluir:",
-            choices=choices
-        ).execute()
+        orphan_id = self._select_choice("Selecione o registro órfão para excluir:", orphan_choices)
 
         # Confirma exclusão
         if inquirer.confirm("Tem certeza que deseja excluir este registro?", default=False).execute():
             if self.db.delete_orphan_record(orphan_id):
+                self._orphan_version += 1
                 print("\nRegistro órfão excluído com sucesso!")
             else:
                 print("\nErro ao excluir registro órfão")
         else:
             print("\nExclusão cancelada")
 
-        input("Pressione Enter para continuar...")
+        self._pause()
     
     def _manage_config(self):
         """Gerencia configurações."""
+        handlers = {
+            'show': self._show_config,
+            'jira': self._config_jira,
+        }
+
         while True:
             action = inquirer.select(
                 message="Configurações:",
-                choices=[
-                    Choice("show", "[Ver]     Ver configurações"),
-                    Choice("jira", "[Jira]    Configurar Jira"),
-                    Separator(),
-                    Choice("back", "[Voltar]  Voltar")
-                ]
+                choices=self._CONFIG_MENU_CHOICES
             ).execute()
             
             if action == "back":
                 break
-            elif action == "show":
-                self._show_config()
-            elif action == "jira":
-                self._config_jira()
+
+            handler = handlers.get(action)
+            if handler:
+                handler()
     
     def _show_config(self):
         """Mostra configurações."""
-        config = self.config.get_all_settings()
-        
-        print("\nConfigurações atuais:")
-        print("=" * 30)
-        
-        for key, value in config.items():
-            if 'token' in key.lower() or 'password' in key.lower():
-                display_value = '*' * len(str(value)) if value else 'Não configurado'
-            else:
-                display_value = value or 'Não configurado'
-            print(f"{key}: {display_value}")
-        
-        input("\nPressione Enter para continuar...")
+        version = self.config.version
+        if self._config_view_cache is None or self._config_view_cache[0] != version:
+            lines = ["\nConfigurações atuais:", "=" * 30]
+            for key, value in self.config.get_all_settings().items():
+                if _SECRET_KEY_RE.search(key):
+                    display_value = _SECRET_MASK if value else 'Não configurado'
+                else:
+                    display_value = value or 'Não configurado'
+                lines.append(f"{key}: {display_value}")
+            self._config_view_cache = (version, lines)
+        self._pause(*self._config_view_cache[1], "")
     
     def _config_jira(self):
         """Configura Jira."""
@@ -351,20 +713,20 @@ class InteractiveInterface:
         url = inquirer.text(
             message="URL do servidor Jira:",
             default=current_url,
-            validate=lambda x: len(x) > 0,
+            validate=_is_nonempty,
             invalid_message="URL não pode estar vazia"
         ).execute()
         
         user = inquirer.text(
             message="Usuário do Jira:",
             default=current_user,
-            validate=lambda x: len(x) > 0,
+            validate=_is_nonempty,
             invalid_message="Usuário não pode estar vazio"
         ).execute()
         
         token = inquirer.secret(
             message="Token de API do Jira:",
-            validate=lambda x: len(x) > 0,
+            validate=_is_nonempty,
             invalid_message="Token não pode estar vazio"
         ).execute()
         
@@ -379,21 +741,33 @@ class InteractiveInterface:
         if inquirer.confirm("Testar conexão com o Jira?", default=True).execute():
             self._test_jira_connection()
         
-        input("Pressione Enter para continuar...")
+        self._pause()
     
+    def _jira_client_for_config(self) -> "JiraClient":
+        """Retorna o cliente atual se as credenciais não mudaram, ou um novo cliente."""
+        from ..jira_integration.client import JiraClient
+
+        jira_config = self.config.get_jira_config()
+        credentials = (jira_config['url'], jira_config['user'], jira_config['token'])
+        client = self.jira_client
+        if client is not None and (client.server_url, client.username, client.api_token) == credentials:
+            return client
+        return JiraClient(*credentials)
+
     def _test_jira_connection(self):
         """Testa conexão com Jira."""
         print("\nTestando conexão com Jira...")
+        # O teste explícito substitui a conexão aberta na inicialização
+        self._jira_connect_future = None
         
         try:
-            url = self.config.get_setting('jira_url')
-            user = self.config.get_setting('jira_user')
-            token = self.config.get_setting('jira_token')
-            
-            jira = JiraClient(url, user, token)
+            jira = self._jira_client_for_config()
             if jira.connect():
                 print("Conexão com Jira estabelecida com sucesso!")
                 self.jira_client = jira
+                self._invalidate_jira_cache()
+                # Aquece o cache de projetos e status enquanto o usuário navega
+                self._submit(jira.warm_cache)
             else:
                 print("Falha na conexão com Jira")
         except Exception as e:
@@ -406,131 +780,111 @@ class InteractiveInterface:
         if is_running:
             action = inquirer.select(
                 message="Monitoramento está rodando:",
-                choices=[
-                    Choice("stop",   "[Stop]    Parar monitoramento"),
-                    Choice("status", "[Status]  Ver status"),
-                    Separator(),
-                    Choice("back",   "[Voltar]  Voltar")
-                ]
+                choices=self._MONITOR_RUNNING_CHOICES
             ).execute()
             
-            if action == "stop":
-                print("Parando monitoramento...")
-                self.monitor.stop_monitoring()
-                print("Monitoramento parado!")
-                input("Pressione Enter para continuar...")
+            match action:
+                case "stop":
+                    print("Parando monitoramento...")
+                    self.monitor.stop_monitoring()
+                    self._pause("Monitoramento parado!")
         else:
             action = inquirer.select(
                 message="Monitoramento está parado:",
-                choices=[
-                    Choice("start",          "[Start]     Iniciar monitoramento"),
-                    Choice("start_specific", "[Caminhos]  Monitorar caminhos específicos"),
-                    Separator(),
-                    Choice("back",           "[Voltar]    Voltar")
-                ]
+                choices=self._MONITOR_STOPPED_CHOICES
             ).execute()
             
-            if action == "start":
-                print("Iniciando monitoramento...")
-                self.monitor.start_monitoring()
-                print("Monitoramento iniciado!")
-                input("Pressione Enter para continuar...")
-            elif action == "start_specific":
-                # TODO: Implementar seleção de caminhos específicos
-                print("Funcionalidade em desenvolvimento...")
-                input("Pressione Enter para continuar...")
+            match action:
+                case "start":
+                    print("Iniciando monitoramento...")
+                    self.monitor.start_monitoring()
+                    self._pause("Monitoramento iniciado!")
+                case "start_specific":
+                    # TODO: Implementar seleção de caminhos específicos
+                    self._pause("Funcionalidade em desenvolvimento...")
     
     def _manage_jira(self):
         """Gerencia integração Jira."""
-        while True:
-            # Verifica se Jira está configurado
-            is_configured = self.config.is_jira_configured()
-            is_connected = self.jira_client and self.jira_client.is_connected()
+        handlers = {
+            'test': self._test_jira_connection,
+            'projects': self._show_jira_projects,
+            'status': self._discover_project_statuses,
+            'workflow': self._analyze_issue_workflow,
+            'automation': self._configure_status_automation,
+            'issues': self._show_my_jira_issues,
+            'worklog': self._create_test_worklog,
+            'config': self._config_jira,
+        }
 
-            status_text = "[Conectado]" if is_connected else ("[Configurado]" if is_configured else "[Nao configurado]")
+        self._await_jira_connection()
+        self._prefetch_jira_data()
+        status_text = self._jira_status_text()
 
+        while True:
             action = inquirer.select(
                 message=f"Integração Jira {status_text}:",
-                choices=[
-                    Choice("test",       "[Test]      Testar conexão"),
-                    Choice("projects",   "[Projetos]  Ver projetos disponíveis"),
-                    Choice("status",     "[Status]    Descobrir status de projeto"),
-                    Choice("workflow",   "[Workflow]  Analisar workflow de issue"),
-                    Choice("automation", "[Auto]      Configurar automação de status"),
-                    Separator(),
-                    Choice("issues",     "[Issues]    Buscar minhas issues"),
-                    Choice("worklog",    "[Worklog]   Criar worklog de teste"),
-                    Choice("config",     "[Config]    Configurar credenciais"),
-                    Separator(),
-                    Choice("back",       "[Voltar]    Voltar")
-                ]
+                choices=self._JIRA_MENU_CHOICES
             ).execute()
 
             if action == "back":
                 break
-            elif action == "test":
-                self._test_jira_connection()
-            elif action == "projects":
-                self._show_jira_projects()
-            elif action == "status":
-                self._discover_project_statuses()
-            elif action == "workflow":
-                self._analyze_issue_workflow()
-            elif action == "automation":
-                self._configure_status_automation()
-            elif action == "issues":
-                self._show_my_jira_issues()
-            elif action == "worklog":
-                self._create_test_worklog()
-            elif action == "config":
-                self._config_jira()
 
+            handler = handlers.get(action)
+            if handler:
+                handler()
+
+            # Só testar ou reconfigurar muda o estado da conexão
+            if action in ('test', 'config'):
+                status_text = self._jira_status_text()
+
+    def _jira_status_text(self) -> str:
+        """Retorna o rótulo de estado do Jira exibido no menu."""
+        if self._jira_is_connected():
+            return "[Conectado]"
+        return "[Configurado]" if self.config.is_jira_configured() else "[Nao configurado]"
+
+    @_require_jira
     def _show_my_jira_issues(self):
         """Mostra issues do usuário no Jira."""
-        if not self.jira_client or not self.jira_client.is_connected():
-            print("\nJira não está conectado")
-            input("Pressione Enter para continuar...")
-            return
-
         print("\nBuscando suas issues no Jira...")
-        issues = self.jira_client.get_my_issues()
+        # O Jira já devolve apenas as issues que serão exibidas
+        issues = self._take_prefetched(
+            '_my_issues_future',
+            lambda: self.jira_client.get_my_issues(max_results=_MY_ISSUES_LIMIT)
+        )
 
         if not issues:
             print("Nenhuma issue encontrada")
         else:
-            print(f"\nEncontradas {len(issues)} issues:")
-            print("=" * 50)
-            for issue in issues[:10]:  # Mostra apenas as 10 primeiras
-                print(f"Ticket: {issue['key']} - {issue['summary']}")
-                print(f"   Status: {issue['status']}")
-                print()
+            lines = [f"\nSuas {len(issues)} issues atualizadas mais recentemente:", "=" * 50]
+            for issue in issues:
+                lines.append(f"Ticket: {issue['key']} - {issue['summary']}")
+                lines.append(f"   Status: {issue['status']}")
+                lines.append("")
+            self._write_lines(lines)
 
-        input("Pressione Enter para continuar...")
+        self._pause()
 
+    @_require_jira
     def _create_test_worklog(self):
         """Cria um worklog de teste."""
-        if not self.jira_client or not self.jira_client.is_connected():
-            print("\nJira não está conectado")
-            input("Pressione Enter para continuar...")
-            return
-
         issue_key = inquirer.text(
             message="Digite a issue para criar worklog de teste:",
-            validate=lambda x: len(x) > 0,
+            validate=_is_nonempty,
             invalid_message="Issue não pode estar vazia"
         ).execute()
 
         time_spent = inquirer.text(
             message="Tempo gasto (ex: 1h 30m):",
             default="30m",
-            validate=lambda x: len(x) > 0,
+            validate=_is_nonempty,
             invalid_message="Tempo não pode estar vazio"
         ).execute()
 
         description = inquirer.text(
             message="Descrição do trabalho:",
             default="Teste de integração Dev Peace",
-            validate=lambda x: len(x) > 0,
+            validate=_is_nonempty,
             invalid_message="Descrição não pode estar vazia"
         ).execute()
 
@@ -542,102 +896,80 @@ class InteractiveInterface:
         else:
             print("Erro ao criar worklog")
 
-        input("Pressione Enter para continuar...")
+        self._pause()
 
+    @_require_jira
     def _show_jira_projects(self):
         """Mostra projetos disponíveis no Jira."""
-        if not self.jira_client or not self.jira_client.is_connected():
-            print("\nJira não está conectado")
-            input("Pressione Enter para continuar...")
-            return
-
         print("\nBuscando projetos do Jira...")
-        projects = self.jira_client.get_projects()
+        projects = self._get_projects()
 
         if not projects:
-            print("Nenhum projeto encontrado")
-            input("Pressione Enter para continuar...")
+            self._pause("Nenhum projeto encontrado")
             return
 
-        print(f"\nEncontrados {len(projects)} projetos:")
-        print("=" * 50)
-
+        lines = [f"\nEncontrados {len(projects)} projetos:", "=" * 50]
         for project in projects:
-            print(f"Key: {project['key']} - {project['name']}")
+            lines.append(f"Key: {project['key']} - {project['name']}")
             if project['description']:
-                print(f"   Desc: {project['description']}")
+                lines.append(f"   Desc: {project['description']}")
             if project['lead']:
-                print(f"   Lead: {project['lead']}")
-            print()
-
-        print("Dica: Use 'Descobrir status de projeto' para ver os status disponíveis")
-        input("Pressione Enter para continuar...")
+                lines.append(f"   Lead: {project['lead']}")
+            lines.append("")
+        lines.append("Dica: Use 'Descobrir status de projeto' para ver os status disponíveis")
+        self._pause(*lines)
 
+    @_require_jira
     def _discover_project_statuses(self):
         """Descobre status de um projeto."""
-        if not self.jira_client or not self.jira_client.is_connected():
-            print("\nJira não está conectado")
-            input("Pressione Enter para continuar...")
-            return
-
-        # Primeiro, mostra projetos disponíveis
-        projects = self.jira_client.get_projects()
+        # Primeiro, mostra projetos disponíveis (normalmente já adiantados pelo menu)
+        projects = self._get_projects()
         if not projects:
-            print("\nNenhum projeto encontrado")
-            input("Pressione Enter para continuar...")
+            self._pause("\nNenhum projeto encontrado")
             return
 
         # Permite selecionar um projeto
-        project_choices = [Choice(p['key'], f"{p['key']} - {p['name']}") for p in projects]
-        project_choices.append(Choice("manual", "[Manual] Digitar chave manualmente"))
+        project_choices = [*self._project_choices(projects), self._MANUAL_PROJECT_CHOICE]
 
-        selected_project = inquirer.select(
-            message="Selecione o projeto:",
-            choices=project_choices
-        ).execute()
+        # Os status chegam enquanto o usuário escolhe o projeto
+        self._prefetch_all_statuses()
+        selected_project = self._select_choice("Selecione o projeto:", project_choices)
 
         if selected_project == "manual":
             project_key = inquirer.text(
                 message="Digite a chave do projeto (ex: PROJ):",
-                validate=lambda x: len(x) > 0,
+                validate=_is_nonempty,
                 invalid_message="Chave do projeto não pode estar vazia"
             ).execute()
         else:
             project_key = selected_project
 
         print(f"\nBuscando status do projeto {project_key}...")
-        statuses = self.jira_client.get_project_statuses(project_key)
+        statuses = self._get_project_statuses(project_key)
 
         if not statuses:
-            print(f"Nenhum status encontrado para o projeto {project_key}")
-            input("Pressione Enter para continuar...")
+            self._pause(f"Nenhum status encontrado para o projeto {project_key}")
             return
 
-        print(f"\nStatus disponíveis no projeto {project_key}:")
-        print("=" * 40)
-
-        for status in statuses:
-            print(f"Status: {status['name']}")
+        lines = [f"\nStatus disponíveis no projeto {project_key}:", "=" * 40]
+        lines.extend(f"Status: {status}" for status in statuses)
+        self._write_lines(lines)
 
         # Pergunta se quer configurar automação baseada nestes status
         if inquirer.confirm(
             f"Deseja configurar automação baseada nos status do projeto {project_key}?",
             default=True
         ).execute():
-            self._apply_project_automation(project_key, [s['name'] for s in statuses])
+            self._apply_project_automation(project_key, statuses)
 
-        input("\nPressione Enter para continuar...")
+        self._pause("")
 
+    @_require_jira
     def _analyze_issue_workflow(self):
         """Analisa workflow de uma issue específica."""
-        if not self.jira_client or not self.jira_client.is_connected():
-            print("\nJira não está conectado")
-            input("Pressione Enter para continuar...")
-            return
-
         issue_key = inquirer.text(
             message="Digite a chave da issue (ex: PROJ-123):",
-            validate=lambda x: len(x) > 0 and '-' in x,
+            validate=_is_issue_key,
             invalid_message="Digite uma chave válida (ex: PROJ-123)"
         ).execute()
 
@@ -645,21 +977,22 @@ class InteractiveInterface:
         workflow_info = self.jira_client.get_issue_workflow_statuses(issue_key)
 
         if not workflow_info:
-            print(f"Não foi possível obter informações da issue {issue_key}")
-            input("Pressione Enter para continuar...")
+            self._pause(f"Não foi possível obter informações da issue {issue_key}")
             return
 
-        print(f"\nIssue: {issue_key}")
-        print("=" * 30)
-        print(f"Status atual: {workflow_info['current_status']}")
-        print(f"Projeto: {workflow_info['project']}")
-        print(f"Tipo: {workflow_info['issue_type']}")
-
-        print("\nTransições disponíveis:")
+        lines = [
+            f"\nIssue: {issue_key}",
+            "=" * 30,
+            f"Status atual: {workflow_info['current_status']}",
+            f"Projeto: {workflow_info['project']}",
+            f"Tipo: {workflow_info['issue_type']}",
+            "\nTransições disponíveis:",
+        ]
         for transition in workflow_info['available_transitions']:
-            print(f"  * {transition['name']} -> {transition['to_status']}")
+            lines.append(f"  * {transition['name']} -> {transition['to_status']}")
             if transition['description']:
-                print(f"    Desc: {transition['description']}")
+                lines.append(f"    Desc: {transition['description']}")
+        self._write_lines(lines)
 
         # Pergunta se quer configurar automação baseada nesta issue
         if inquirer.confirm(
@@ -668,103 +1001,80 @@ class InteractiveInterface:
         ).execute():
             self._apply_project_automation(workflow_info['project'], workflow_info['all_possible_statuses'])
 
-        input("\nPressione Enter para continuar...")
+        self._pause("")
 
     def _configure_status_automation(self):
         """Configura automação de status."""
-        from ..core.status_manager import StatusManager
-
-        status_manager = StatusManager(self.config, self.jira_client)
+        status_manager = self._get_status_manager()
+        handlers = {
+            'show': self._show_automation_rules,
+            'enable': self._enable_automation,
+            'disable': self._disable_automation,
+            'configure': self._configure_automation_from_jira,
+            'rules': self._manage_individual_rules,
+            'reset': self._reset_automation_rules,
+        }
 
         while True:
             action = inquirer.select(
                 message="Configurar automação de status:",
-                choices=[
-                    Choice("show",      "[Ver]     Ver regras atuais"),
-                    Choice("enable",    "[ON]      Habilitar automação"),
-                    Choice("disable",   "[OFF]     Desabilitar automação"),
-                    Choice("configure", "[Config]  Configurar baseado no Jira"),
-                    Choice("rules",     "[Regras]  Gerenciar regras individuais"),
-                    Choice("reset",     "[Reset]   Resetar para padrões"),
-                    Separator(),
-                    Choice("back",      "[Voltar]  Voltar")
-                ]
+                choices=self._AUTOMATION_MENU_CHOICES
             ).execute()
 
             if action == "back":
                 break
-            elif action == "show":
-                self._show_automation_rules(status_manager)
-            elif action == "enable":
-                self._enable_automation(status_manager)
-            elif action == "disable":
-                self._disable_automation(status_manager)
-            elif action == "configure":
-                self._configure_automation_from_jira(status_manager)
-            elif action == "rules":
-                self._manage_individual_rules(status_manager)
-            elif action == "reset":
-                self._reset_automation_rules(status_manager)
+
+            handler = handlers.get(action)
+            if handler:
+                handler(status_manager)
 
     def _show_automation_rules(self, status_manager):
         """Mostra regras de automação atuais."""
         rules = status_manager.status_rules
-
-        print("\nRegras de Automação de Status")
-        print("=" * 40)
-        print(f"Status geral: {'[Habilitado]' if rules.get('enabled') else '[Desabilitado]'}")
-        
-        # Mostra configuração de reversão automática
         auto_revert = rules.get('auto_revert_on_session_end', False)
-        print(f"Reversão automática: {'[Habilitada]' if auto_revert else '[Desabilitada]'}")
-        print()
+
+        lines = [
+            "\nRegras de Automação de Status",
+            "=" * 40,
+            f"Status geral: {'[Habilitado]' if rules.get('enabled') else '[Desabilitado]'}",
+            # Mostra configuração de reversão automática
+            f"Reversão automática: {'[Habilitada]' if auto_revert else '[Desabilitada]'}",
+            "",
+        ]
 
         events = rules.get('events', {})
         for event_name, transitions in events.items():
-            title = event_name.replace('on_', '').replace('_', ' ').title()
-            print(f"Evento {title}:")
+            title = event_title(event_name)
+            lines.append(f"Evento {title}:")
             if not transitions:
-                print("   (Nenhuma regra configurada)")
+                lines.append("   (Nenhuma regra configurada)")
             else:
                 for i, trans in enumerate(transitions, 1):
                     from_val = trans.get('from')
                     to_val = trans.get('to')
-                    print(f"   {i}. {from_val} -> {to_val}")
-            print()
-
-        input("Pressione Enter para continuar...")
+                    lines.append(f"   {i}. {from_val} -> {to_val}")
+            lines.append("")
+        self._pause(*lines)
 
     def _enable_automation(self, status_manager):
         """Habilita automação de status."""
-        rules = status_manager.status_rules.copy()
-        rules['enabled'] = True
-        status_manager.save_status_rules(rules)
-        print("\nAutomação de status habilitada!")
-        input("Pressione Enter para continuar...")
+        with status_manager.mutate_rules() as rules:
+            rules['enabled'] = True
+        self._pause("\nAutomação de status habilitada!")
 
     def _disable_automation(self, status_manager):
         """Desabilita automação de status."""
-        rules = status_manager.status_rules.copy()
-        rules['enabled'] = False
-        status_manager.save_status_rules(rules)
-        print("\nAutomação de status desabilitada!")
-        input("Pressione Enter para continuar...")
+        with status_manager.mutate_rules() as rules:
+            rules['enabled'] = False
+        self._pause("\nAutomação de status desabilitada!")
 
+    @_require_jira
     def _configure_automation_from_jira(self, status_manager):
         """Configura automação baseada no Jira."""
-        if not self.jira_client or not self.jira_client.is_connected():
-            print("\nJira não está conectado")
-            input("Pressione Enter para continuar...")
-            return
-
         # Escolhe método de configuração
         method = inquirer.select(
             message="Como deseja descobrir os status?",
-            choices=[
-                Choice("project", "[Projeto] Por projeto"),
-                Choice("issue", "[Issue] Por issue específica"),
-                Choice("back", "[Voltar] Voltar")
-            ]
+            choices=self._DISCOVERY_METHOD_CHOICES
         ).execute()
 
         if method == "back":
@@ -776,25 +1086,22 @@ class InteractiveInterface:
 
     def _configure_by_project(self, status_manager):
         """Configura automação por projeto."""
-        projects = self.jira_client.get_projects()
+        projects = self._get_projects()
         if not projects:
-            print("\nNenhum projeto encontrado")
-            input("Pressione Enter para continuar...")
+            self._pause("\nNenhum projeto encontrado")
             return
 
         # Seleciona projeto
-        project_choices = [Choice(p['key'], f"{p['key']} - {p['name']}") for p in projects]
-        project_choices.append(Choice("manual", "[Manual] Digitar chave manualmente"))
+        project_choices = [*self._project_choices(projects), self._MANUAL_PROJECT_CHOICE]
 
-        selected_project = inquirer.select(
-            message="Selecione o projeto:",
-            choices=project_choices
-        ).execute()
+        # Os status chegam enquanto o usuário escolhe o projeto
+        self._prefetch_all_statuses()
+        selected_project = self._select_choice("Selecione o projeto:", project_choices)
 
         if selected_project == "manual":
             project_key = inquirer.text(
                 message="Digite a chave do projeto:",
-                validate=lambda x: len(x) > 0,
+                validate=_is_nonempty,
                 invalid_message="Chave não pode estar vazia"
             ).execute()
         else:
@@ -802,21 +1109,19 @@ class InteractiveInterface:
 
         # Busca status do projeto
         print(f"\nDescobrindo status do projeto {project_key}...")
-        statuses = self.jira_client.get_project_statuses(project_key)
+        statuses = self._get_project_statuses(project_key)
 
         if not statuses:
-            print(f"Nenhum status encontrado for {project_key}")
-            input("Pressione Enter para continuar...")
+            self._pause(f"Nenhum status encontrado for {project_key}")
             return
 
-        status_names = [s['name'] for s in statuses]
-        self._apply_project_automation(project_key, status_names)
+        self._apply_project_automation(project_key, statuses)
 
     def _configure_by_issue(self, status_manager):
         """Configura automação por issue."""
         issue_key = inquirer.text(
             message="Digite a chave da issue (ex: PROJ-123):",
-            validate=lambda x: len(x) > 0 and '-' in x,
+            validate=_is_issue_key,
             invalid_message="Digite uma chave válida"
         ).execute()
 
@@ -824,62 +1129,31 @@ class InteractiveInterface:
         workflow_info = self.jira_client.get_issue_workflow_statuses(issue_key)
 
         if not workflow_info:
-            print(f"Não foi possível analisar a issue {issue_key}")
-            input("Pressione Enter para continuar...")
+            self._pause(f"Não foi possível analisar a issue {issue_key}")
             return
 
         self._apply_project_automation(workflow_info['project'], workflow_info['all_possible_statuses'])
 
     def _apply_project_automation(self, project_key, available_statuses):
         """Aplica configuração de automação baseada nos status disponíveis."""
-        from ..core.status_manager import StatusManager
-
-        status_manager = StatusManager(self.config, self.jira_client)
+        status_manager = self._get_status_manager()
 
-        print(f"\nConfigurando automação para projeto {project_key}...")
-        print("Status disponíveis:")
-        for status in available_statuses:
-            print(f"  Status: {status}")
+        lines = [f"\nConfigurando automação para projeto {project_key}...", "Status disponíveis:"]
+        lines.extend(f"  Status: {status}" for status in available_statuses)
+        self._write_lines(lines)
 
         # Mapeia status automaticamente
-        status_mapping = {
-            'todo': [
-                'To Do', 'TODO', 'Backlog', 'New', 'Open', 'Created',
-                'A FAZER', 'FILA', 'Na fila', 'Fila de', 'DEMANDAS'
-            ],
-            'in_progress': [
-                'In Progress', 'IN PROGRESS', 'Em Progresso', 'Doing', 'Development',
-                'FAZENDO', 'Trabalhando', 'Implementando', 'CRIANDO', 'EDITANDO',
-                'Editando', 'Criando', 'GRAVANDO', 'Gravando', 'Analisando', 'ANALISANDO'
-            ],
-            'done': [
-                'Done', 'DONE', 'Closed', 'Resolved', 'Finalizado', 'Complete',
-                'FEITO', 'FINALIZADO', 'Concluído', 'Resolvido', 'Implementado'
-            ]
-        }
-
-        found_statuses = {}
-        for category, possible_names in status_mapping.items():
-            for status in available_statuses:
-                if any(possible.lower() in status.lower() or status.lower() in possible.lower()
-                       for possible in possible_names):
-                    found_statuses[category] = status
-                    break
+        found_statuses = map_statuses(available_statuses)
 
         if found_statuses:
-            print("\nMapeamento automático encontrado:")
-            for category, status in found_statuses.items():
-                print(f"  {category}: {status}")
+            lines = ["\nMapeamento automático encontrado:"]
+            lines.extend(f"  {category}: {status}" for category, status in found_statuses.items())
+            self._write_lines(lines)
 
             # Oferece opções de configuração
             config_action = inquirer.select(
                 message="Como deseja proceder?",
-                choices=[
-                    Choice("auto", "[Auto] Aplicar configuração automática"),
-                    Choice("edit", "[Edit] Editar configuração antes de aplicar"),
-                    Choice("manual", "[Manual] Configurar tudo manualmente"),
-                    Choice("cancel", "[Cancel] Cancelar")
-                ]
+                choices=self._MAPPING_ACTION_CHOICES
             ).execute()
 
             if config_action == "auto":
@@ -897,104 +1171,44 @@ class InteractiveInterface:
             else:
                 print("Configure manualmente usando 'Gerenciar regras individuais'")
 
-        input("\nPressione Enter para continuar...")
+        self._pause("")
 
     def _apply_automatic_config(self, status_manager, found_statuses):
         """Aplica configuração automática."""
-        rules = status_manager.status_rules.copy()
-        if 'events' not in rules:
-            rules['events'] = {'on_work_start': [], 'on_first_commit': [], 'on_work_complete': []}
-
+        config_mapping = {}
         if 'todo' in found_statuses and 'in_progress' in found_statuses:
-            rules['events']['on_work_start'] = [
-                {'from': found_statuses['todo'], 'to': found_statuses['in_progress']}
-            ]
-            print(f"Configurado início: {found_statuses['todo']} -> {found_statuses['in_progress']}")
-
+            config_mapping['on_work_start'] = {'from': found_statuses['todo'], 'to': found_statuses['in_progress']}
         if 'in_progress' in found_statuses and 'done' in found_statuses:
-            rules['events']['on_work_complete'] = [
-                {'from': found_statuses['in_progress'], 'to': found_statuses['done']}
-            ]
-            print(f"Configurado fim: {found_statuses['in_progress']} -> {found_statuses['done']}")
+            config_mapping['on_work_complete'] = {'from': found_statuses['in_progress'], 'to': found_statuses['done']}
 
-        # Habilita automação
-        rules['enabled'] = True
-        status_manager.save_status_rules(rules)
-        print("Configuração salva e automação habilitada!")
+        self._apply_custom_config(status_manager, config_mapping)
 
     def _edit_and_apply_config(self, status_manager, found_statuses, available_statuses):
         """Permite editar a configuração antes de aplicar."""
         print("\nEditando configuração...")
 
+        events_to_configure = inquirer.checkbox(
+            message="Quais eventos configurar? (Espaço marca, Enter confirma)",
+            choices=self._EDIT_EVENT_CHOICES
+        ).execute()
+
         # Cria mapeamento editável
         config_mapping = {}
+        for event_name, label, from_category, to_category in self._EDIT_EVENT_RULES:
+            if event_name not in events_to_configure:
+                continue
 
-        # Configura regra de início de trabalho
-        print("\nConfigurando regra: Início de Trabalho")
-        print("Quando você entra em um repositório, de qual status para qual status a issue deve ir?")
-
-        from_status_start = self._select_status_from_list(
-            available_statuses,
-            "Selecione o status DE ORIGEM (ex: A Fazer, Fila, etc.):",
-            found_statuses.get('todo')
-        )
-
-        to_status_start = self._select_status_from_list(
-            available_statuses,
-            "Selecione o status DE DESTINO (ex: Em Progresso, Fazendo, etc.):",
-            found_statuses.get('in_progress')
-        )
-
-        if from_status_start and to_status_start:
-            config_mapping['on_work_start'] = {
-                'from': from_status_start,
-                'to': to_status_start,
-                'enabled': True
-            }
-
-        # Configura regra de primeiro commit (opcional)
-        if inquirer.confirm("Deseja configurar mudança de status no primeiro commit?", default=False).execute():
-            print("\nConfigurando regra: Primeiro Commit")
-
-            from_status_commit = self._select_status_from_list(
+            print(f"\nConfigurando regra: {label}")
+            from_status, to_status = self._pair_status_prompt(
                 available_statuses,
-                "Status de origem para primeiro commit:",
-                found_statuses.get('todo')
+                label,
+                found_statuses.get(from_category),
+                found_statuses.get(to_category)
             )
-
-            to_status_commit = self._select_status_from_list(
-                available_statuses,
-                "Status de destino para primeiro commit:",
-                found_statuses.get('in_progress')
-            )
-
-            if from_status_commit and to_status_commit:
-                config_mapping['on_first_commit'] = {
-                    'from': from_status_commit,
-                    'to': to_status_commit,
-                    'enabled': True
-                }
-
-        # Configura regra de finalização (opcional)
-        if inquirer.confirm("Deseja configurar mudança de status ao finalizar trabalho?", default=False).execute():
-            print("\nConfigurando regra: Finalização de Trabalho")
-
-            from_status_complete = self._select_status_from_list(
-                available_statuses,
-                "Status de origem para finalização:",
-                found_statuses.get('in_progress')
-            )
-
-            to_status_complete = self._select_status_from_list(
-                available_statuses,
-                "Status de destino para finalização:",
-                found_statuses.get('done')
-            )
-
-            if from_status_complete and to_status_complete:
-                config_mapping['on_work_complete'] = {
-                    'from': from_status_complete,
-                    'to': to_status_complete,
+            if from_status and to_status:
+                config_mapping[event_name] = {
+                    'from': from_status,
+                    'to': to_status,
                     'enabled': True
                 }
 
@@ -1004,90 +1218,117 @@ class InteractiveInterface:
         else:
             print("Nenhuma configuração foi definida")
 
+    def _pair_status_prompt(self, available_statuses, label, default_from=None, default_to=None):
+        """Pergunta os status de origem e destino de uma regra; (None, None) se cancelado."""
+        from_status = self._select_status_from_list(
+            available_statuses,
+            f"Status DE ORIGEM para {label.lower()}:",
+            default_from
+        )
+        if not from_status:
+            return None, None
+
+        to_status = self._select_status_from_list(
+            available_statuses,
+            f"Status DE DESTINO para {label.lower()}:",
+            default_to
+        )
+        if not to_status:
+            return None, None
+        return from_status, to_status
+
+    def _status_choices(self, available_statuses: List[str]) -> List[Choice]:
+        """Retorna as opções dos status, reaproveitadas enquanto a lista for a mesma."""
+        # A mesma lista é oferecida para origem e destino de cada regra
+        if self._status_choices_cache is None or self._status_choices_cache[0] is not available_statuses:
+            choices = [Choice(status, status) for status in available_statuses]
+            self._status_choices_cache = (available_statuses, choices)
+        return self._status_choices_cache[1]
+
     def _select_status_from_list(self, available_statuses, message, default_status=None):
-        """Permite selecionar um status de uma lista com busca fuzzy."""
+        """Seleciona um status da lista ou digita um manualmente; None se cancelado."""
         if not available_statuses:
-            return inquirer.text(message=message, default=default_status or "").execute()
+            return inquirer.text(message=message, default=default_status or "").execute() or None
 
-        choices = [Choice(status, status) for status in available_statuses]
-        choices.append(Separator())
-        choices.append(Choice(None, "[X] Não configurar / Cancelar"))
+        status_choices = self._status_choices(available_statuses)
 
         # Define o padrão se fornecido
         default_choice = default_status if default_status in available_statuses else None
 
-        selected = inquirer.select(
-            message=message,
-            choices=choices,
-            default=default_choice,
-            filter=lambda val: val
-        ).execute()
+        if len(status_choices) > _FUZZY_MIN_CHOICES:
+            # Listas longas: busca fuzzy. O default do fuzzy é o texto da busca, então o
+            # padrão vai para o topo da lista em vez de filtrar as demais opções
+            if default_choice:
+                status_choices = sorted(status_choices, key=lambda choice: choice.value != default_choice)
+            selected = inquirer.fuzzy(
+                message=message,
+                choices=[*status_choices, *self._STATUS_FUZZY_TAIL]
+            ).execute()
+        else:
+            selected = inquirer.select(
+                message=message,
+                choices=[*status_choices, *self._STATUS_SELECT_TAIL],
+                default=default_choice
+            ).execute()
 
+        if selected == _CANCEL_STATUS:
+            return None
+        if selected == _CUSTOM_STATUS:
+            return inquirer.text(
+                message=f"Digite o {message.lower()}",
+                default=default_status or ""
+            ).execute() or None
         return selected
 
     def _apply_custom_config(self, status_manager, config_mapping):
         """Aplica configuração customizada."""
-        rules = status_manager.status_rules.copy()
-        if 'events' not in rules:
-            rules['events'] = {'on_work_start': [], 'on_first_commit': [], 'on_work_complete': []}
-
-        for event_name, config in config_mapping.items():
-            if event_name in rules['events']:
-                rules['events'][event_name] = [
-                    {'from': config['from'], 'to': config['to']}
-                ]
-                print(f"Configurado {event_name}: {config['from']} -> {config['to']}")
-
-        # Habilita automação geral
-        rules['enabled'] = True
-        status_manager.save_status_rules(rules)
-        print("Configuração customizada salva e automação habilitada!")
+        lines = []
+        with status_manager.mutate_rules() as rules:
+            for event_name, config in config_mapping.items():
+                if event_name in rules['events']:
+                    rules['events'][event_name] = [
+                        {'from': config['from'], 'to': config['to']}
+                    ]
+                    lines.append(f"Configurado {event_name}: {config['from']} -> {config['to']}")
+
+            # Habilita automação geral
+            rules['enabled'] = True
+        lines.append("Configuração salva e automação habilitada!")
+        self._write_lines(lines)
 
     def _manual_config_from_statuses(self, status_manager, available_statuses):
         """Configuração completamente manual."""
         print("\nConfiguração Manual Completa")
         print("Vamos configurar as transições para cada evento...")
 
-        while True:
-            event_name = inquirer.select(
-                message="Selecione um evento para adicionar regras:",
-                choices=[
-                    Choice("on_work_start",    "[Start]     Início de Trabalho"),
-                    Choice("on_first_commit",  "[Commit]    Primeiro Commit"),
-                    Choice("on_work_complete", "[Complete]  Finalização de Trabalho"),
-                    Separator(),
-                    Choice("done",             "[OK]        Finalizar configuração")
-                ]
-            ).execute()
+        # Todas as transições adicionadas são salvas de uma vez, ao final
+        with status_manager.mutate_rules() as rules:
+            while True:
+                event_name = inquirer.select(
+                    message="Selecione um evento para adicionar regras:",
+                    choices=self._MANUAL_CONFIG_EVENT_CHOICES
+                ).execute()
 
-            if event_name == "done":
-                break
+                if event_name == "done":
+                    break
 
-            self._add_transition_to_event(status_manager, event_name)
+                self._add_transition_to_event(status_manager, event_name)
 
-        # Pergunta se quer habilitar automação
-        if inquirer.confirm("Habilitar automação com essas configurações?", default=True).execute():
-            rules = status_manager.status_rules.copy()
-            rules['enabled'] = True
-            status_manager.save_status_rules(rules)
+            # Pergunta se quer habilitar automação
+            enable = inquirer.confirm("Habilitar automação com essas configurações?", default=True).execute()
+            if enable:
+                rules['enabled'] = True
+        if enable:
             print("Automação habilitada!")
 
     def _manage_individual_rules(self, status_manager):
         """Gerencia regras individuais."""
-        rules = status_manager.status_rules.copy()
-        events = rules.get('events', {})
-
-        event_choices = [
-            Choice("on_work_start",    "[Start]     Início de Trabalho"),
-            Choice("on_first_commit",  "[Commit]    Primeiro Commit"),
-            Choice("on_work_complete", "[Complete]  Finalização de Trabalho"),
-            Separator(),
-            Choice("back",             "[Voltar]    Voltar")
-        ]
+        # Status globais ficam prontos enquanto o usuário escolhe evento e projeto
+        self._prefetch_all_statuses()
 
         selected_event = inquirer.select(
             message="Selecione o evento para gerenciar regras:",
-            choices=event_choices
+            choices=self._RULES_EVENT_CHOICES
         ).execute()
 
         if selected_event == "back":
@@ -1097,116 +1338,117 @@ class InteractiveInterface:
 
     def _manage_event_transitions(self, status_manager, event_name):
         """Gerencia transições de um evento específico."""
-        while True:
-            rules = status_manager.status_rules.copy()
-            transitions = rules.get('events', {}).get(event_name, [])
-            
-            title = event_name.replace('on_', '').replace('_', ' ').title()
-            print(f"\nGerenciando: {title}")
-            
-            choices = []
-            if transitions:
-                for i, trans in enumerate(transitions):
-                    choices.append(Choice(i, f"[Remover]  {trans['from']} -> {trans['to']}"))
-                choices.append(Separator())
-            
-            choices.append(Choice("add",  "[Add]      Adicionar nova transição"))
-            choices.append(Choice("back", "[Voltar]   Voltar"))
-
-            action = inquirer.select(
-                message="Selecione uma ação:",
-                choices=choices
-            ).execute()
+        title = event_title(event_name)
+
+        # Adições e remoções são salvas de uma vez, ao voltar
+        with status_manager.mutate_rules() as rules:
+            transitions = rules['events'].setdefault(event_name, [])
+
+            # Opções só são remontadas depois que as transições mudam
+            choices = None
+            while True:
+                if choices is None:
+                    choices = [
+                        Choice(i, f"[Remover]  {trans['from']} -> {trans['to']}")
+                        for i, trans in enumerate(transitions)
+                    ]
+                    choices.extend(self._TRANSITION_ACTION_TAIL if choices else self._TRANSITION_ACTION_CHOICES)
+
+                print(f"\nGerenciando: {title}")
+                action = inquirer.select(
+                    message="Selecione uma ação:",
+                    choices=choices
+                ).execute()
 
-            if action == "back":
-                break
-            elif action == "add":
-                self._add_transition_to_event(status_manager, event_name)
-            else:
-                # Remover transição
-                idx = int(action)
-                removed = transitions.pop(idx)
-                status_manager.save_status_rules(rules)
-                print(f"Transição removida: {removed['from']} -> {removed['to']}")
-
-    def _add_transition_to_event(self, status_manager, event_name):
-        """Adiciona uma nova transição a um evento com filtragem por projeto."""
-        rules = status_manager.status_rules.copy()
-        
-        # Garante que o cliente Jira está conectado
-        if not self.jira_client or not self.jira_client.is_connected():
+                if action == "back":
+                    break
+                elif action == "add":
+                    if self._add_transition_to_event(status_manager, event_name):
+                        choices = None
+                else:
+                    # Remover transição
+                    removed = transitions.pop(int(action))
+                    print(f"Transição removida: {removed['from']} -> {removed['to']}")
+                    choices = None
+
+    def _add_transition_to_event(self, status_manager, event_name) -> bool:
+        """Adiciona uma nova transição a um evento com filtragem por projeto; retorna se adicionou."""
+        # Garante que o cliente Jira está conectado, reaproveitando o cliente da sessão
+        if not self._jira_is_connected():
             if self.config.is_jira_configured():
-                jira_config = self.config.get_jira_config()
-                temp_jira = JiraClient(jira_config['url'], jira_config['user'], jira_config['token'])
-                if temp_jira.connect():
-                    self.jira_client = temp_jira
-
-        if not self.jira_client or not self.jira_client.is_connected():
-            print("\nJira não está conectado. Configure as credenciais primeiro.")
-            input("Pressione Enter para continuar...")
-            return
+                jira = self._jira_client_for_config()
+                if jira.connect():
+                    self.jira_client = jira
+
+        if not self._jira_is_connected():
+            self._pause("\nJira não está conectado. Configure as credenciais primeiro.")
+            return False
 
         # 1. Seleção de Projeto para filtrar status
         print("\nBuscando projetos...")
-        projects = self.jira_client.get_projects()
-        
-        project_choices = [Choice("all", "[Global]  Todos os Status (Global)")]
-        for p in projects:
-            project_choices.append(Choice(p['key'], f"[{p['key']}]  {p['name']}"))
+        # Status globais (opção padrão) são buscados em paralelo com os projetos
+        self._prefetch_all_statuses()
+        projects = self._get_projects()
         
-        selected_project = inquirer.select(
-            message="Filtrar status de qual projeto?",
-            choices=project_choices,
-            default="all"
-        ).execute()
+        project_choices = [self._GLOBAL_STATUSES_CHOICE, *self._project_choices(projects)]
+
+        selected_project = self._select_choice("Filtrar status de qual projeto?", project_choices)
 
         # 2. Busca de Status baseada no projeto
         if selected_project == "all":
             print("Buscando todos os status globais...")
-            available_statuses = self.jira_client.get_all_statuses()
+            available_statuses = self._take_prefetched('_all_statuses_future', self.jira_client.get_all_statuses)
         else:
             print(f"Buscando status do projeto {selected_project}...")
-            available_statuses = self.jira_client.get_project_statuses(selected_project)
+            available_statuses = self._get_project_statuses(selected_project)
 
         if not available_statuses:
             print("Aviso: Nenhum status encontrado.")
             if not inquirer.confirm("Deseja digitar manualmente?", default=True).execute():
-                return
+                return False
 
-        def get_status_choice(message):
-            if available_statuses:
-                choice = inquirer.select(
-                    message=message,
-                    choices=[Choice(s, s) for s in available_statuses] + [Choice("custom", "[Manual]  Digitar manualmente...")]
-                ).execute()
-                
-                if choice == "custom":
-                    return inquirer.text(message=f"Digite o {message.lower()}").execute()
-                return choice
-            else:
-                return inquirer.text(message=message).execute()
+        # 3. Seleção de Origem (vários de uma vez) e Destino
+        from_statuses = self._select_origin_statuses(available_statuses)
+        if not from_statuses:
+            return False
 
-        # 3. Seleção de Origem e Destino
-        from_status = get_status_choice("Status de ORIGEM:")
-        if not from_status: return
+        to_status = self._select_status_from_list(available_statuses, "Status de DESTINO:")
+        if not to_status:
+            return False
 
-        to_status = get_status_choice("Status de DESTINO:")
-        if not to_status: return
+        # Uma transição por origem; origem igual ao destino não muda nada
+        new_transitions = [
+            {'from': from_status, 'to': to_status}
+            for from_status in from_statuses if from_status != to_status
+        ]
+        if not new_transitions:
+            print("Nenhuma regra adicionada: origem e destino são o mesmo status")
+            return False
+
+        with status_manager.mutate_rules() as rules:
+            rules['events'].setdefault(event_name, []).extend(new_transitions)
+        self._write_lines([
+            f"Nova regra adicionada: {trans['from']} -> {trans['to']}" for trans in new_transitions
+        ])
+        return True
+
+    def _select_origin_statuses(self, available_statuses) -> List[str]:
+        """Marca de uma vez os status de origem de uma regra; lista vazia se cancelado."""
+        if not available_statuses:
+            status = inquirer.text(message="Status de ORIGEM:").execute()
+            return [status] if status else []
 
-        if from_status and to_status:
-            if 'events' not in rules:
-                rules['events'] = {'on_work_start': [], 'on_first_commit': [], 'on_work_complete': []}
-            
-            if event_name not in rules['events']:
-                rules['events'][event_name] = []
-            
-            rules['events'][event_name].append({
-                'from': from_status,
-                'to': to_status
-            })
-            
-            status_manager.save_status_rules(rules)
-            print(f"Nova regra adicionada: {from_status} -> {to_status}")
+        selected = inquirer.checkbox(
+            message="Status de ORIGEM (espaço marca, Enter confirma):",
+            choices=[*self._status_choices(available_statuses), self._CUSTOM_STATUS_CHOICE]
+        ).execute()
+
+        from_statuses = [status for status in selected if status != _CUSTOM_STATUS]
+        if len(from_statuses) < len(selected):
+            custom = inquirer.text(message="Digite o status de origem:").execute()
+            if custom:
+                from_statuses.append(custom)
+        return from_statuses
 
     def _reset_automation_rules(self, status_manager):
         """Reseta regras para os padrões."""
@@ -1216,4 +1458,4 @@ class InteractiveInterface:
         else:
             print("Reset cancelado")
 
-        input("Pressione Enter para continuar...")
+        self._pause()
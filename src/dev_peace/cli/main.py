@@ -3,319 +3,92 @@ Interface de linha de comando principal do Dev Peace.
 """
 
 import argparse
+import re
 import sys
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from ..core.activity_monitor import DevPeaceActivityMonitor
-from ..database.models import DatabaseManager
-from ..config.settings import ConfigManager
-from .interactive import InteractiveInterface
-
-# Configuração de logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+from .parser import create_parser
 
 logger = logging.getLogger(__name__)
 
+# Quantidade de issues exibidas no teste de conexão com o Jira
+_TEST_ISSUES_LIMIT = 3
+
+# Chaves de configuração cujo valor não deve ser exibido
+_SECRET_KEY_RE = re.compile(r'token|password', re.IGNORECASE)
+
+# Máscara de tamanho fixo, para não revelar o tamanho do segredo
+_SECRET_MASK = '********'
+
+# Comandos cujo subparser não tem argumentos (ver parser.py)
+_NO_ARGUMENT_COMMANDS = frozenset({'stop', 'status', 'orphans', 'interactive', 'docs', 'stats', 'logs'})
+
+# Opção do comando config que define cada campo da configuração do Jira
+_JIRA_CONFIG_OPTIONS = {'url': '--jira-url', 'user': '--jira-user', 'token': '--jira-token'}
+
+# Intervalo (em segundos) entre as buscas do daemon por novos repositórios
+_DAEMON_REFRESH_INTERVAL = 30
+
+# Documentação HTML na raiz do projeto (src/dev_peace/cli -> raiz)
+_DOCS_PATH = Path(__file__).resolve().parents[3] / "docs" / "index.html"
+
+# Classe do cliente do Jira, importada no primeiro uso (ver _jira_client_class)
+_jira_client_cls = None
+
+
+def _jira_client_class():
+    """Retorna a classe JiraClient, importando o módulo do Jira só quando necessário."""
+    global _jira_client_cls
+    if _jira_client_cls is None:
+        from ..jira_integration.client import JiraClient
+        _jira_client_cls = JiraClient
+    return _jira_client_cls
+
+
+def _write_lines(lines):
+    """Escreve várias linhas no terminal com uma única chamada."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 class DevPeaceCLI:
     """Interface de linha de comando do Dev Peace."""
     
     def __init__(self):
-        self.db = DatabaseManager()
-        self.monitor = DevPeaceActivityMonitor(self.db)
-        self.config = ConfigManager()
-        self.interactive = InteractiveInterface(self.db, self.monitor, self.config)
+        # Criados sob demanda: --help, docs e stats não abrem o banco nem carregam o monitor
+        self._db = None
+        self._monitor = None
+        self._config = None
+        self._jira = None
+
+    @property
+    def db(self):
+        """Banco de dados, aberto no primeiro uso."""
+        if self._db is None:
+            from ..database.models import DatabaseManager
+            self._db = DatabaseManager()
+        return self._db
+
+    @property
+    def monitor(self):
+        """Monitor de atividades, criado no primeiro uso."""
+        if self._monitor is None:
+            from ..core.activity_monitor import DevPeaceActivityMonitor
+            self._monitor = DevPeaceActivityMonitor(self.db)
+        return self._monitor
+
+    @property
+    def config(self):
+        """Configurações, carregadas no primeiro uso."""
+        if self._config is None:
+            from ..config.settings import ConfigManager
+            self._config = ConfigManager()
+        return self._config
     
-    def create_parser(self) -> argparse.ArgumentParser:
+    def create_parser(self, argv: Optional[list] = None) -> argparse.ArgumentParser:
         """Cria o parser de argumentos."""
-        parser = argparse.ArgumentParser(
-            prog='dev-peace',
-            description=r'''
-  _____                             _.-.                   _____                    
- |  __ \                        .-.  `) |  .-.            |  __ \                   
- | |  | | _____   __        _.'`. .~./  \.~. .`'._        | |__) |__  __ _  ___ ___ 
- | |  | |/ _ \ \ / /    .-'`.'-'.'.-:    ;-.'.'-'.`'-.    |  ___/ _ \/ _` |/ __/ _ \
- | |__| |  __/\ V /      `'`'`'`'`   \  /   `'`'`'`'`     | |  |  __/ (_| | (_|  __/
- |_____/ \___| \_/                   /||\                 |_|   \___|\__,_|\___\___|
-                          jgs       / ^^ \                                       
-                                    `'``'`
-
-Dev Peace - O observador zen que transforma seu caos de desenvolvimento em worklogs organizados!
-    
-    Cansado de esquecer de registrar suas horas no Jira? 
-    Farto de tentar lembrar o que você fez ontem?
-    Dev Peace está aqui para trazer paz à sua vida de dev! 
-    
-    Ele observa silenciosamente seus repositórios, detecta quando você entra neles,
-    monitora suas modificações, registra seus commits e ainda por cima conversa
-    com o Jira para você. É quase como ter um assistente pessoal, mas sem o salário!
-            ''',
-            epilog='''
-Exemplos de uso:
-    dev-peace start                    # Inicia o monitoramento (modo zen ativado)
-    dev-peace add /path/to/repo        # Adiciona um repo para observação
-    dev-peace status                   # Vê o que está rolando
-    dev-peace interactive              # Interface para os preguiçosos
-    dev-peace docs                     # Abre a documentação no navegador
-    dev-peace orphans                  # Vê os registros perdidos na vida
-    
-Que a paz esteja com seu código!
-            ''',
-            formatter_class=argparse.RawDescriptionHelpFormatter
-        )
-        
-        subparsers = parser.add_subparsers(dest='command', help='Comandos disponíveis')
-        
-        # Comando start
-        start_parser = subparsers.add_parser(
-            'start', 
-            help='Inicia o monitoramento (finalmente, produtividade!)'
-        )
-        start_parser.add_argument(
-            '--paths', 
-            nargs='+', 
-            help='Caminhos específicos para monitorar (senão monitora tudo)'
-        )
-        start_parser.add_argument(
-            '--daemon', 
-            action='store_true', 
-            help='Roda em background como um ninja silencioso'
-        )
-        
-        # Comando stop
-        subparsers.add_parser(
-            'stop', 
-            help='Para o monitoramento (hora do café!)'
-        )
-        
-        # Comando add
-        add_parser = subparsers.add_parser(
-            'add', 
-            help='Adiciona um repositório para monitoramento'
-        )
-        add_parser.add_argument(
-            'path', 
-            help='Caminho do repositório Git (tem que ser Git, né!)'
-        )
-        
-        # Comando status
-        subparsers.add_parser(
-            'status', 
-            help='Mostra o status atual (spoiler: provavelmente está tudo bem)'
-        )
-        
-        # Comando list
-        list_parser = subparsers.add_parser(
-            'list', 
-            help='Lista repositórios monitorados'
-        )
-        list_parser.add_argument(
-            '--active-only', 
-            action='store_true', 
-            help='Só os repositórios ativos (os que prestam)'
-        )
-        
-        # Comando orphans
-        subparsers.add_parser(
-            'orphans', 
-            help='Mostra registros órfãos (coitadinhos sem issue pai)'
-        )
-        
-        # Comando config
-        config_parser = subparsers.add_parser(
-            'config', 
-            help='Configurações do Jira e outras coisas importantes'
-        )
-        config_parser.add_argument(
-            '--jira-url', 
-            help='URL do servidor Jira'
-        )
-        config_parser.add_argument(
-            '--jira-user', 
-            help='Usuário do Jira'
-        )
-        config_parser.add_argument(
-            '--jira-token', 
-            help='Token de API do Jira (guarde com carinho)'
-        )
-        config_parser.add_argument(
-            '--show',
-            action='store_true',
-            help='Mostra configurações atuais'
-        )
-        config_parser.add_argument(
-            '--test-jira',
-            action='store_true',
-            help='Testa conexão com Jira'
-        )
-        
-        # Comando interactive
-        subparsers.add_parser(
-            'interactive',
-            help='Interface interativa bonita (para os que gostam de cores)'
-        )
-
-        # Comando docs
-        subparsers.add_parser(
-            'docs',
-            help='Abre a documentação no navegador'
-        )
-        
-        # Comando stats
-        subparsers.add_parser(
-            'stats',
-            help='Estatísticas detalhadas (para os nerds)'
-        )
-
-        # Comando logs
-        subparsers.add_parser(
-            'logs',
-            help='Mostra os logs do serviço em tempo real'
-        )
-
-        # Comando daemon
-        daemon_parser = subparsers.add_parser(
-            'daemon',
-            help='Executa como daemon (serviço em background)'
-        )
-        daemon_parser.add_argument(
-            '--log-level',
-            choices=['debug', 'info', 'warning', 'error'],
-            default='info',
-            help='Nível de log para o daemon'
-        )
-
-        # Comando status-issue
-        status_parser = subparsers.add_parser(
-            'status-issue',
-            help='Gerencia status de issues no Jira'
-        )
-        status_parser.add_argument(
-            'issue_key',
-            help='Chave da issue (ex: PROJ-123)'
-        )
-        status_parser.add_argument(
-            'new_status',
-            help='Novo status da issue'
-        )
-        status_parser.add_argument(
-            '--comment',
-            help='Comentário opcional para a transição'
-        )
-
-        # Comando automation
-        automation_parser = subparsers.add_parser(
-            'automation',
-            help='Gerencia automação de status de issues'
-        )
-        automation_subparsers = automation_parser.add_subparsers(dest='automation_action', help='Ações de automação')
-
-        # Subcomando show
-        automation_subparsers.add_parser(
-            'show',
-            help='Mostra regras de automação atuais'
-        )
-
-        # Subcomando enable
-        enable_parser = automation_subparsers.add_parser(
-            'enable',
-            help='Habilita automação de status'
-        )
-        enable_parser.add_argument(
-            'rule_name',
-            nargs='?',
-            choices=['on_work_start', 'on_first_commit', 'on_work_complete'],
-            help='Nome da regra específica para habilitar'
-        )
-
-        # Subcomando disable
-        disable_parser = automation_subparsers.add_parser(
-            'disable',
-            help='Desabilita automação de status'
-        )
-        disable_parser.add_argument(
-            'rule_name',
-            nargs='?',
-            choices=['on_work_start', 'on_first_commit', 'on_work_complete'],
-            help='Nome da regra específica para desabilitar'
-        )
-
-        # Subcomando reset
-        automation_subparsers.add_parser(
-            'reset',
-            help='Reseta regras para os padrões'
-        )
-
-        # Subcomando auto-revert
-        revert_parser = automation_subparsers.add_parser(
-            'auto-revert',
-            help='Configura reversão automática de status'
-        )
-        revert_parser.add_argument(
-            'action',
-            choices=['enable', 'disable', 'status'],
-            help='Ação: enable (habilitar), disable (desabilitar), status (mostrar status)'
-        )
-
-        # Subcomando configure
-        configure_parser = automation_subparsers.add_parser(
-            'configure',
-            help='Configura regras baseadas no seu Jira'
-        )
-        configure_parser.add_argument(
-            '--project',
-            help='Chave do projeto para descobrir status (ex: PROJ)'
-        )
-        configure_parser.add_argument(
-            '--issue',
-            help='Issue exemplo para descobrir workflow (ex: PROJ-123)'
-        )
-        configure_parser.add_argument(
-            '--apply',
-            action='store_true',
-            help='Aplica automaticamente a configuração sugerida'
-        )
-
-        # Comando jira-status
-        jira_status_parser = subparsers.add_parser(
-            'jira-status',
-            help='Descobre status e workflows do Jira'
-        )
-        jira_status_subparsers = jira_status_parser.add_subparsers(dest='jira_status_action', help='Ações de status')
-
-        # Subcomando projects
-        jira_status_subparsers.add_parser(
-            'projects',
-            help='Lista projetos acessíveis'
-        )
-
-        # Subcomando list
-        list_status_parser = jira_status_subparsers.add_parser(
-            'list',
-            help='Lista status de um projeto'
-        )
-        list_status_parser.add_argument(
-            'project_key',
-            help='Chave do projeto (ex: PROJ)'
-        )
-
-        # Subcomando workflow
-        workflow_parser = jira_status_subparsers.add_parser(
-            'workflow',
-            help='Mostra workflow de uma issue'
-        )
-        workflow_parser.add_argument(
-            'issue_key',
-            help='Chave da issue (ex: PROJ-123)'
-        )
-        
-        return parser
+        return create_parser(argv)
     
     def handle_start(self, args):
         """Inicia o monitoramento."""
@@ -332,9 +105,7 @@ Que a paz esteja com seu código!
                 print("Pressione Ctrl+C para parar")
                 
                 try:
-                    while self.monitor.is_running:
-                        import time
-                        time.sleep(1)
+                    self.monitor.wait_until_stopped()
                 except KeyboardInterrupt:
                     print("\nParando Dev Peace...")
                     self.monitor.stop_monitoring()
@@ -372,23 +143,26 @@ Que a paz esteja com seu código!
     
     def handle_status(self, args):
         """Mostra status atual."""
-        stats = self.monitor.get_repository_stats()
-        
-        print("Status do Dev Peace")
-        print("=" * 30)
-        print(f"Status: {'Rodando' if stats['is_running'] else 'Parado'}")
-        print(f"Repositórios: {stats['total_repositories']} total, {stats['active_repositories']} ativos")
-        print(f"Sessões ativas: {stats['active_sessions']}")
-        print(f"Registros órfãos: {stats['orphan_records']}")
-        print(f"Caminhos monitorados: {stats['monitored_paths']}")
+        snapshot = self.monitor.get_status_snapshot()
+        stats = snapshot.stats
+        
+        lines = [
+            "Status do Dev Peace",
+            "=" * 30,
+            f"Status: {'Rodando' if stats['is_running'] else 'Parado'}",
+            f"Repositórios: {stats['total_repositories']} total, {stats['active_repositories']} ativos",
+            f"Sessões ativas: {stats['active_sessions']}",
+            f"Registros órfãos: {stats['orphan_records']}",
+            f"Caminhos monitorados: {stats['monitored_paths']}",
+        ]
         
         # Mostra sessões ativas
-        active_sessions = self.monitor.get_active_sessions()
-        if active_sessions:
-            print("\nSessões ativas:")
-            for session in active_sessions:
-                print(f"  * {session.branch_name} - {session.jira_issue or 'Sem issue'}")
+        if snapshot.active_sessions:
+            lines.append("\nSessões ativas:")
+            for session in snapshot.active_sessions:
+                lines.append(f"  * {session.branch_name} - {session.jira_issue or 'Sem issue'}")
         
+        _write_lines(lines)
         return 0
     
     def handle_list(self, args):
@@ -402,17 +176,16 @@ Que a paz esteja com seu código!
             print("Nenhum repositório encontrado")
             return 0
         
-        print(f"Repositórios {'ativos' if args.active_only else 'monitorados'}:")
-        print("=" * 50)
-        
+        lines = [f"Repositórios {'ativos' if args.active_only else 'monitorados'}:", "=" * 50]
         for repo in repositories:
             status = "[Ativo]" if repo.is_active else "[Inativo]"
-            print(f"{status} {repo.name}")
-            print(f"   Local: {repo.path}")
+            lines.append(f"{status} {repo.name}")
+            lines.append(f"   Local: {repo.path}")
             if repo.last_activity:
-                print(f"   Ultima atividade: {repo.last_activity}")
-            print()
+                lines.append(f"   Ultima atividade: {repo.last_activity}")
+            lines.append("")
         
+        _write_lines(lines)
         return 0
     
     def handle_orphans(self, args):
@@ -423,17 +196,16 @@ Que a paz esteja com seu código!
             print("Nenhum registro órfão! Tudo organizado!")
             return 0
         
-        print("Registros órfãos (sem issue pai):")
-        print("=" * 40)
-        
+        lines = ["Registros órfãos (sem issue pai):", "=" * 40]
         for orphan in orphans:
-            print(f"Branch: {orphan.branch_name}")
-            print(f"   Tempo: {orphan.total_minutes} minutos")
-            print(f"   Atividades: {orphan.activities_count}")
-            print(f"   Criado: {orphan.created_at}")
-            print()
-        
-        print("Dica: Use 'dev-peace interactive' para associar issues manualmente")
+            lines.append(f"Branch: {orphan.branch_name}")
+            lines.append(f"   Tempo: {orphan.total_minutes} minutos")
+            lines.append(f"   Atividades: {orphan.activities_count}")
+            lines.append(f"   Criado: {orphan.created_at}")
+            lines.append("")
+        
+        lines.append("Dica: Use 'dev-peace interactive' para associar issues manualmente")
+        _write_lines(lines)
         return 0
     
     def handle_config(self, args):
@@ -443,8 +215,8 @@ Que a paz esteja com seu código!
             print("Configurações atuais:")
             print("=" * 30)
             for key, value in config.items():
-                if 'token' in key.lower() or 'password' in key.lower():
-                    value = '*' * len(str(value)) if value else 'Não configurado'
+                if _SECRET_KEY_RE.search(key):
+                    value = _SECRET_MASK if value else 'Não configurado'
                 print(f"{key}: {value}")
             return 0
         
@@ -467,52 +239,78 @@ Que a paz esteja com seu código!
 
         return 0
 
+    def _require_jira_config(self) -> Optional[Dict[str, str]]:
+        """Retorna a configuração do Jira, ou None (indicando o que falta) se incompleta."""
+        jira_config = self.config.get_jira_config()
+        missing = [_JIRA_CONFIG_OPTIONS[key] for key, value in jira_config.items() if not value]
+        if missing:
+            print(f"Jira não está configurado: falta {', '.join(missing)}")
+            print("Use: dev-peace config --jira-url <url> --jira-user <user> --jira-token <token>")
+            return None
+        return jira_config
+
+    def _connect_jira_or_fail(self):
+        """Retorna um cliente do Jira conectado, ou None após explicar a falha."""
+        # Reaproveitado pelos demais acessos ao Jira nesta execução
+        if self._jira is not None:
+            return self._jira
+
+        jira_config = self._require_jira_config()
+        if jira_config is None:
+            return None
+
+        JiraClient = _jira_client_class()
+        jira = JiraClient(jira_config['url'], jira_config['user'], jira_config['token'])
+        if not jira.connect():
+            print("Falha na conexão com Jira")
+            print("Verifique suas credenciais e URL")
+            return None
+
+        self._jira = jira
+        return jira
+
     def _test_jira_connection(self):
         """Testa conexão com Jira."""
-        from ..jira_integration.client import JiraClient
-
         print("Testando conexão com Jira...")
 
-        jira_config = self.config.get_jira_config()
-        if not all(jira_config.values()):
-            print("Jira não está configurado completamente")
-            print("Use: dev-peace config --jira-url <url> --jira-user <user> --jira-token <token>")
+        jira = self._connect_jira_or_fail()
+        if jira is None:
             return
 
+        print("Conexão com Jira estabelecida com sucesso!")
+
         try:
-            jira = JiraClient(jira_config['url'], jira_config['user'], jira_config['token'])
-            if jira.connect():
-                print("Conexão com Jira estabelecida com sucesso!")
-
-                # Busca algumas issues como teste
-                print("Buscando suas issues...")
-                issues = jira.get_my_issues()
-                if issues:
-                    print(f"Encontradas {len(issues)} issues atribuídas a você")
-                    for issue in issues[:3]:  # Mostra apenas as 3 primeiras
-                        print(f"  * {issue['key']} - {issue['summary']}")
-                else:
-                    print("Nenhuma issue encontrada")
+            # Busca algumas issues como teste
+            print("Buscando suas issues...")
+            # O Jira devolve apenas as issues exibidas, mas informa o total
+            total, issues = jira.get_my_issues_with_total(max_results=_TEST_ISSUES_LIMIT)
+            if total is None and not issues:
+                # Sem total nem issues: a busca falhou (detalhes no log)
+                print("Erro ao buscar suas issues no Jira")
+            elif issues:
+                if total is not None:
+                    print(f"Encontradas {total} issues atribuídas a você")
+                print(f"Suas {len(issues)} issues atualizadas mais recentemente:")
+                for issue in issues:
+                    print(f"  * {issue['key']} - {issue['summary']}")
             else:
-                print("Falha na conexão com Jira")
-                print("Verifique suas credenciais e URL")
+                print("Nenhuma issue encontrada")
         except Exception as e:
             print(f"Erro ao testar conexão: {e}")
     
     def handle_interactive(self, args):
         """Inicia interface interativa."""
-        return self.interactive.run()
+        # Importado aqui: InquirerPy só é carregado quando a interface é usada
+        from .interactive import InteractiveInterface
+
+        interactive = InteractiveInterface(self.db, self.monitor, self.config)
+        return interactive.run()
 
     def handle_docs(self, args):
         """Abre a documentação no navegador."""
         import webbrowser
-        import os
-        from pathlib import Path
-
-        # Encontra o arquivo de documentação
-        current_dir = Path(__file__).parent.parent.parent.parent
-        docs_path = current_dir / "docs" / "index.html"
 
+        docs_path = _DOCS_PATH
         if not docs_path.exists():
             print("Arquivo de documentação não encontrado")
             print(f"Procurado em: {docs_path}")
@@ -520,7 +318,7 @@ Que a paz esteja com seu código!
 
         try:
             # Abre no navegador padrão
-            file_url = f"file://{docs_path.absolute()}"
+            file_url = docs_path.as_uri()
             webbrowser.open(file_url)
             print("Documentação aberta no navegador!")
             print(f"URL: {file_url}")
@@ -540,7 +338,6 @@ Que a paz esteja com seu código!
         """Mostra os logs do serviço."""
         import platform
         import os
-        from pathlib import Path
 
         system = platform.system()
         
@@ -564,7 +361,6 @@ Que a paz esteja com seu código!
     def handle_daemon(self, args):
         """Executa como daemon."""
         import signal
-        import sys
 
         # Configura logging para daemon
         log_level = getattr(logging, args.log_level.upper())
@@ -600,17 +396,10 @@ Que a paz esteja com seu código!
             self.monitor.start_monitoring()
             logger.info("Monitoramento iniciado em modo daemon")
 
-            # Loop principal do daemon
-            counter = 0
-            while self.monitor.is_running:
-                import time
-                time.sleep(1)
-                counter += 1
-                
-                # A cada 30 segundos, verifica se há novos repositórios no banco
-                if counter >= 30:
-                    self.monitor.refresh_repositories()
-                    counter = 0
+            # Loop principal do daemon: enquanto o monitor roda, verifica
+            # a cada 30 segundos se há novos repositórios no banco
+            while not self.monitor.wait_until_stopped(_DAEMON_REFRESH_INTERVAL):
+                self.monitor.refresh_repositories()
 
         except Exception as e:
             logger.error(f"Erro no daemon: {e}")
@@ -621,22 +410,11 @@ Que a paz esteja com seu código!
 
     def handle_status_issue(self, args):
         """Gerencia status de issues no Jira."""
-        from ..jira_integration.client import JiraClient
-
-        # Verifica configuração do Jira
-        jira_config = self.config.get_jira_config()
-        if not all(jira_config.values()):
-            print("Jira não está configurado")
-            print("Use: dev-peace config --jira-url <url> --jira-user <user> --jira-token <token>")
+        jira = self._connect_jira_or_fail()
+        if jira is None:
             return 1
 
         try:
-            # Conecta ao Jira
-            jira = JiraClient(jira_config['url'], jira_config['user'], jira_config['token'])
-            if not jira.connect():
-                print("Falha na conexão com Jira")
-                return 1
-
             print(f"Alterando status da issue {args.issue_key} para '{args.new_status}'...")
 
             # Busca a issue
@@ -675,26 +453,26 @@ Que a paz esteja com seu código!
             print("Use: dev-peace automation --help")
             return 1
 
-        status_manager = StatusManager(self.config)
-
-        if args.automation_action == 'show':
-            return self._show_automation_rules(status_manager)
-        elif args.automation_action == 'enable':
-            return self._enable_automation_rule(status_manager, args.rule_name)
-        elif args.automation_action == 'disable':
-            return self._disable_automation_rule(status_manager, args.rule_name)
-        elif args.automation_action == 'reset':
-            return self._reset_automation_rules(status_manager)
-        elif args.automation_action == 'configure':
-            return self._configure_automation_rules(status_manager, args)
-        elif args.automation_action == 'auto-revert':
-            return self._handle_auto_revert(status_manager, args)
-        else:
+        handlers = {
+            'show': self._show_automation_rules,
+            'enable': self._enable_automation_rule,
+            'disable': self._disable_automation_rule,
+            'reset': self._reset_automation_rules,
+            'configure': self._configure_automation_rules,
+            'auto-revert': self._handle_auto_revert,
+        }
+
+        handler = handlers.get(args.automation_action)
+        if handler is None:
             print(f"Ação não reconhecida: {args.automation_action}")
             return 1
 
-    def _show_automation_rules(self, status_manager):
+        return handler(StatusManager(self.config), args)
+
+    def _show_automation_rules(self, status_manager, args):
         """Mostra regras de automação atuais."""
+        from ..core.status_manager import event_title
+
         rules = status_manager.status_rules
 
         print("Regras de Automação de Status")
@@ -710,7 +488,7 @@ Que a paz esteja com seu código!
 
         events = rules.get('events', {})
         for event_name, transitions in events.items():
-            title = event_name.replace('on_', '').replace('_', ' ').title()
+            title = event_title(event_name)
             print(f"Evento {title}:")
             if not transitions:
                 print("   (Nenhuma regra configurada)")
@@ -723,39 +501,28 @@ Que a paz esteja com seu código!
 
         return 0
 
-    def _enable_automation_rule(self, status_manager, event_name):
+    def _enable_automation_rule(self, status_manager, args):
         """Habilita automação (comando simplificado para habilitar geral ou evento)."""
-        rules = status_manager.status_rules.copy()
-
-        if event_name:
-            # No novo formato, a "habilitação" de um evento é ter regras nele.
-            # Este comando CLI agora serve apenas para habilitar a automação GERAL.
-            print(f"💡 Para gerenciar regras de '{event_name}', use 'dev-peace interactive'")
-            return 1
-        else:
-            # Habilita automação geral
-            rules['enabled'] = True
-            status_manager.save_status_rules(rules)
-            print("Automação de status habilitada")
-
-        return 0
+        return self._set_automation_enabled(status_manager, args.rule_name, True)
 
-    def _disable_automation_rule(self, status_manager, event_name):
+    def _disable_automation_rule(self, status_manager, args):
         """Desabilita automação."""
-        rules = status_manager.status_rules.copy()
+        return self._set_automation_enabled(status_manager, args.rule_name, False)
 
+    def _set_automation_enabled(self, status_manager, event_name, enabled):
+        """Habilita ou desabilita a automação geral."""
         if event_name:
+            # No novo formato, a "habilitação" de um evento é ter regras nele.
+            # Este comando CLI agora serve apenas para a automação GERAL.
             print(f"💡 Para gerenciar regras de '{event_name}', use 'dev-peace interactive'")
             return 1
-        else:
-            # Desabilita automação geral
-            rules['enabled'] = False
-            status_manager.save_status_rules(rules)
-            print("Automação de status desabilitada")
 
+        with status_manager.mutate_rules() as rules:
+            rules['enabled'] = enabled
+        print(f"Automação de status {'habilitada' if enabled else 'desabilitada'}")
         return 0
 
-    def _reset_automation_rules(self, status_manager):
+    def _reset_automation_rules(self, status_manager, args):
         """Reseta regras para os padrões."""
         status_manager.reset_to_defaults()
         print("Regras de automação resetadas para os padrões")
@@ -763,21 +530,17 @@ Que a paz esteja com seu código!
 
     def _configure_automation_rules(self, status_manager, args):
         """Configura regras baseadas no Jira real."""
-        from ..jira_integration.client import JiraClient
+        if not (args.issue or args.project):
+            print("Forneça --project ou --issue para descobrir status")
+            print("Exemplo: dev-peace automation configure --project PROJ")
+            print("Exemplo: dev-peace automation configure --issue PROJ-123")
+            return 1
 
-        # Verifica configuração do Jira
-        jira_config = self.config.get_jira_config()
-        if not all(jira_config.values()):
-            print("Jira não está configurado")
+        jira = self._connect_jira_or_fail()
+        if jira is None:
             return 1
 
         try:
-            # Conecta ao Jira
-            jira = JiraClient(jira_config['url'], jira_config['user'], jira_config['token'])
-            if not jira.connect():
-                print("Falha na conexão com Jira")
-                return 1
-
             print("Descobrindo status do seu Jira...")
 
             # Se foi fornecida uma issue específica
@@ -788,25 +551,23 @@ Que a paz esteja com seu código!
                     print(f"Status atual: {workflow_info['current_status']}")
                     print(f"Projeto: {workflow_info['project']}")
                     print(f"Tipo: {workflow_info['issue_type']}")
-                    print("\nStatus possíveis:")
-                    for status in sorted(set(workflow_info['all_possible_statuses'])):
-                        print(f"  * {status}")
+                    # Sem repetições e em ordem, uma única vez para exibir e sugerir
+                    status_names = sorted(set(workflow_info['all_possible_statuses']))
+                    _write_lines(["\nStatus possíveis:", *(f"  * {status}" for status in status_names)])
 
                     # Sugere configuração baseada nos status encontrados
-                    self._suggest_automation_config(status_manager, workflow_info['all_possible_statuses'], args.apply)
+                    self._suggest_automation_config(status_manager, status_names, args.apply)
                 else:
                     print(f"Não foi possível obter informações da issue {args.issue}")
                     return 1
 
-            # Se foi fornecido um projeto
-            elif args.project:
-                statuses = jira.get_project_statuses(args.project)
-                if statuses:
+            # Senão, foi fornecido um projeto
+            else:
+                # Nomes já sem repetições e ordenados pelo cliente
+                status_names = jira.get_project_statuses(args.project)
+                if status_names:
                     print(f"\nProjeto: {args.project}")
-                    print("Status disponíveis:")
-                    status_names = [s['name'] for s in statuses]
-                    for status in status_names:
-                        print(f"  * {status}")
+                    _write_lines(["Status disponíveis:", *(f"  * {status}" for status in status_names)])
 
                     # Sugere configuração baseada nos status encontrados
                     self._suggest_automation_config(status_manager, status_names, args.apply)
@@ -814,12 +575,6 @@ Que a paz esteja com seu código!
                     print(f"Não foi possível obter status do projeto {args.project}")
                     return 1
 
-            else:
-                print("Forneça --project ou --issue para descobrir status")
-                print("Exemplo: dev-peace automation configure --project PROJ")
-                print("Exemplo: dev-peace automation configure --issue PROJ-123")
-                return 1
-
         except Exception as e:
             print(f"Erro ao configurar automação: {e}")
             return 1
@@ -828,75 +583,62 @@ Que a paz esteja com seu código!
 
     def _handle_auto_revert(self, status_manager, args):
         """Gerencia configuração de reversão automática."""
-        rules = status_manager.status_rules.copy()
-
-        if args.action == 'status':
-            # Mostra status atual
-            auto_revert = rules.get('auto_revert_on_session_end', False)
-            print("Reversão Automática de Status")
-            print("=" * 35)
-            print(f"Status: {'[Habilitada]' if auto_revert else '[Desabilitada]'}")
-
-            if auto_revert:
-                print("\nComo funciona:")
-                print("* Quando você inicia trabalho em uma issue, o status original é salvo")
-                print("* Se o status for alterado automaticamente (ex: Fila desenvolvimento -> Implementando)")
-                print("* Quando a sessão for finalizada, o status volta automaticamente ao original")
-                print("* Exemplo: Implementando -> Fila desenvolvimento")
-            else:
-                print("\nPara habilitar:")
-                print("dev-peace automation auto-revert enable")
+        handlers = {
+            'status': self._show_auto_revert_status,
+            'enable': self._enable_auto_revert,
+            'disable': self._disable_auto_revert,
+        }
 
-            return 0
+        handler = handlers.get(args.action)
+        if handler is None:
+            print(f"Ação não reconhecida: {args.action}")
+            return 1
 
-        elif args.action == 'enable':
-            # Habilita reversão automática
-            rules['auto_revert_on_session_end'] = True
-            status_manager.save_status_rules(rules)
-            print("Reversão automática de status habilitada!")
-            print("Agora o status será revertido automaticamente quando sessões forem finalizadas")
-            return 0
+        return handler(status_manager)
 
-        elif args.action == 'disable':
-            # Desabilita reversão automática
-            rules['auto_revert_on_session_end'] = False
-            status_manager.save_status_rules(rules)
-            print("Reversão automática de status desabilitada")
-            print("Status não serão mais revertidos automaticamente")
-            return 0
+    def _show_auto_revert_status(self, status_manager):
+        """Mostra se a reversão automática está habilitada."""
+        auto_revert = status_manager.status_rules.get('auto_revert_on_session_end', False)
+        print("Reversão Automática de Status")
+        print("=" * 35)
+        print(f"Status: {'[Habilitada]' if auto_revert else '[Desabilitada]'}")
 
+        if auto_revert:
+            print("\nComo funciona:")
+            print("* Quando você inicia trabalho em uma issue, o status original é salvo")
+            print("* Se o status for alterado automaticamente (ex: Fila desenvolvimento -> Implementando)")
+            print("* Quando a sessão for finalizada, o status volta automaticamente ao original")
+            print("* Exemplo: Implementando -> Fila desenvolvimento")
         else:
-            print(f"Ação não reconhecida: {args.action}")
-            return 1
+            print("\nPara habilitar:")
+            print("dev-peace automation auto-revert enable")
+
+        return 0
+
+    def _enable_auto_revert(self, status_manager):
+        """Habilita reversão automática."""
+        with status_manager.mutate_rules() as rules:
+            rules['auto_revert_on_session_end'] = True
+        print("Reversão automática de status habilitada!")
+        print("Agora o status será revertido automaticamente quando sessões forem finalizadas")
+        return 0
+
+    def _disable_auto_revert(self, status_manager):
+        """Desabilita reversão automática."""
+        with status_manager.mutate_rules() as rules:
+            rules['auto_revert_on_session_end'] = False
+        print("Reversão automática de status desabilitada")
+        print("Status não serão mais revertidos automaticamente")
+        return 0
 
     def _suggest_automation_config(self, status_manager, available_statuses, apply_config=False):
         """Sugere configuração baseada nos status disponíveis."""
-        print("\nSugestões de configuração:")
+        from ..core.status_mapping import map_statuses
 
-        # Mapeia status comuns (incluindo variações em português)
-        status_mapping = {
-            'todo': [
-                'To Do', 'TODO', 'Backlog', 'New', 'Open', 'Created',
-                'A FAZER', 'FILA', 'Na fila', 'Fila de', 'DEMANDAS'
-            ],
-            'in_progress': [
-                'In Progress', 'IN PROGRESS', 'Em Progresso', 'Doing', 'Development',
-                'FAZENDO', 'Trabalhando', 'Implementando', 'CRIANDO', 'EDITANDO',
-                'Editando', 'Criando', 'GRAVANDO', 'Gravando', 'Analisando', 'ANALISANDO'
-            ],
-            'done': [
-                'Done', 'DONE', 'Closed', 'Resolved', 'Finalizado', 'Complete',
-                'FEITO', 'FINALIZADO', 'Concluído', 'Resolvido', 'Implementado'
-            ]
-        }
+        print("\nSugestões de configuração:")
 
-        found_statuses = {}
-        for category, possible_names in status_mapping.items():
-            for status in available_statuses:
-                if any(possible.lower() in status.lower() or status.lower() in possible.lower()
-                       for possible in possible_names):
-                    found_statuses[category] = status
-                    break
+        # Sinônimos por categoria já normalizados uma única vez, na importação do módulo
+        found_statuses = map_statuses(available_statuses)
 
         if found_statuses:
             print("\nConfiguração sugerida:")
@@ -910,20 +652,19 @@ Que a paz esteja com seu código!
             if apply_config:
                 # Aplica a configuração automaticamente
                 print("\nConfigurando automaticamente...")
-                rules = status_manager.status_rules.copy()
-
-                if 'todo' in found_statuses and 'in_progress' in found_statuses:
-                    rules['rules']['on_work_start']['from_status'] = [found_statuses['todo']]
-                    rules['rules']['on_work_start']['to_status'] = found_statuses['in_progress']
-                    print(f"Configurado início de trabalho: {found_statuses['todo']} -> {found_statuses['in_progress']}")
-
-                if 'in_progress' in found_statuses and 'done' in found_statuses:
-                    rules['rules']['on_work_complete']['from_status'] = [found_statuses['in_progress']]
-                    rules['rules']['on_work_complete']['to_status'] = found_statuses['done']
-                    print(f"Configurado finalização: {found_statuses['in_progress']} -> {found_statuses['done']}")
+                with status_manager.mutate_rules() as rules:
+                    if 'todo' in found_statuses and 'in_progress' in found_statuses:
+                        rules['events']['on_work_start'] = [
+                            {'from': found_statuses['todo'], 'to': found_statuses['in_progress']}
+                        ]
+                        print(f"Configurado início de trabalho: {found_statuses['todo']} -> {found_statuses['in_progress']}")
+
+                    if 'in_progress' in found_statuses and 'done' in found_statuses:
+                        rules['events']['on_work_complete'] = [
+                            {'from': found_statuses['in_progress'], 'to': found_statuses['done']}
+                        ]
+                        print(f"Configurado finalização: {found_statuses['in_progress']} -> {found_statuses['done']}")
 
-                # Salva as regras
-                status_manager.save_status_rules(rules)
                 print("Configuração salva com sucesso!")
             else:
                 print("\nPara aplicar esta configuração automaticamente:")
@@ -937,26 +678,16 @@ Que a paz esteja com seu código!
 
     def handle_jira_status(self, args):
         """Gerencia descoberta de status do Jira."""
-        from ..jira_integration.client import JiraClient
-
         if not args.jira_status_action:
             print("Ação não especificada")
             print("Use: dev-peace jira-status --help")
             return 1
 
-        # Verifica configuração do Jira
-        jira_config = self.config.get_jira_config()
-        if not all(jira_config.values()):
-            print("Jira não está configurado")
+        jira = self._connect_jira_or_fail()
+        if jira is None:
             return 1
 
         try:
-            # Conecta ao Jira
-            jira = JiraClient(jira_config['url'], jira_config['user'], jira_config['token'])
-            if not jira.connect():
-                print("Falha na conexão com Jira")
-                return 1
-
             if args.jira_status_action == 'projects':
                 return self._list_jira_projects(jira)
             elif args.jira_status_action == 'list':
@@ -1008,8 +739,7 @@ Que a paz esteja com seu código!
         print(f"\nStatus disponíveis no projeto {project_key}:")
         print("=" * 40)
 
-        for status in statuses:
-            print(f"Status: {status['name']}")
+        _write_lines([f"Status: {status}" for status in statuses])
 
         print(f"\nDica: Para configurar automação baseada nestes status:")
         print(f"dev-peace automation configure --project {project_key}")
@@ -1044,12 +774,18 @@ Que a paz esteja com seu código!
     
     def run(self, args=None):
         """Executa o CLI."""
-        parser = self.create_parser()
-        parsed_args = parser.parse_args(args)
-        
-        if not parsed_args.command:
-            parser.print_help()
-            return 0
+        argv = sys.argv[1:] if args is None else args
+
+        # Comandos sem argumentos dispensam a montagem do parser
+        if len(argv) == 1 and argv[0] in _NO_ARGUMENT_COMMANDS:
+            parsed_args = argparse.Namespace(command=argv[0])
+        else:
+            parser = self.create_parser(argv)
+            parsed_args = parser.parse_args(argv)
+
+            if not parsed_args.command:
+                parser.print_help()
+                return 0
         
         # Mapeia comandos para handlers
         handlers = {
@@ -1080,6 +816,13 @@ Que a paz esteja com seu código!
 
 def main():
     """Ponto de entrada principal."""
+    # Configurado só aqui, para não alterar o logging de quem importa o módulo
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
     cli = DevPeaceCLI()
     return cli.run()
 
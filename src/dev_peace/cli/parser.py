@@ -0,0 +1,363 @@
+"""
+Parser de argumentos do Dev Peace.
+
+Só depende de argparse: montar o parser não carrega banco, monitor nem Jira.
+"""
+
+import argparse
+import functools
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+def _build_start(subparsers):
+    """Adiciona o comando start."""
+    start_parser = subparsers.add_parser(
+        'start', 
+        help='Inicia o monitoramento (finalmente, produtividade!)'
+    )
+    start_parser.add_argument(
+        '--paths', 
+        nargs='+', 
+        help='Caminhos específicos para monitorar (senão monitora tudo)'
+    )
+    start_parser.add_argument(
+        '--daemon', 
+        action='store_true', 
+        help='Roda em background como um ninja silencioso'
+    )
+
+
+def _build_stop(subparsers):
+    """Adiciona o comando stop."""
+    subparsers.add_parser(
+        'stop', 
+        help='Para o monitoramento (hora do café!)'
+    )
+
+
+def _build_add(subparsers):
+    """Adiciona o comando add."""
+    add_parser = subparsers.add_parser(
+        'add', 
+        help='Adiciona um repositório para monitoramento'
+    )
+    add_parser.add_argument(
+        'path', 
+        help='Caminho do repositório Git (tem que ser Git, né!)'
+    )
+
+
+def _build_status(subparsers):
+    """Adiciona o comando status."""
+    subparsers.add_parser(
+        'status', 
+        help='Mostra o status atual (spoiler: provavelmente está tudo bem)'
+    )
+
+
+def _build_list(subparsers):
+    """Adiciona o comando list."""
+    list_parser = subparsers.add_parser(
+        'list', 
+        help='Lista repositórios monitorados'
+    )
+    list_parser.add_argument(
+        '--active-only', 
+        action='store_true', 
+        help='Só os repositórios ativos (os que prestam)'
+    )
+
+
+def _build_orphans(subparsers):
+    """Adiciona o comando orphans."""
+    subparsers.add_parser(
+        'orphans', 
+        help='Mostra registros órfãos (coitadinhos sem issue pai)'
+    )
+
+
+def _build_config(subparsers):
+    """Adiciona o comando config."""
+    config_parser = subparsers.add_parser(
+        'config', 
+        help='Configurações do Jira e outras coisas importantes'
+    )
+    config_parser.add_argument(
+        '--jira-url', 
+        help='URL do servidor Jira'
+    )
+    config_parser.add_argument(
+        '--jira-user', 
+        help='Usuário do Jira'
+    )
+    config_parser.add_argument(
+        '--jira-token', 
+        help='Token de API do Jira (guarde com carinho)'
+    )
+    config_parser.add_argument(
+        '--show',
+        action='store_true',
+        help='Mostra configurações atuais'
+    )
+    config_parser.add_argument(
+        '--test-jira',
+        action='store_true',
+        help='Testa conexão com Jira'
+    )
+
+
+def _build_interactive(subparsers):
+    """Adiciona o comando interactive."""
+    subparsers.add_parser(
+        'interactive',
+        help='Interface interativa bonita (para os que gostam de cores)'
+    )
+
+
+def _build_docs(subparsers):
+    """Adiciona o comando docs."""
+    subparsers.add_parser(
+        'docs',
+        help='Abre a documentação no navegador'
+    )
+
+
+def _build_stats(subparsers):
+    """Adiciona o comando stats."""
+    subparsers.add_parser(
+        'stats',
+        help='Estatísticas detalhadas (para os nerds)'
+    )
+
+
+def _build_logs(subparsers):
+    """Adiciona o comando logs."""
+    subparsers.add_parser(
+        'logs',
+        help='Mostra os logs do serviço em tempo real'
+    )
+
+
+def _build_daemon(subparsers):
+    """Adiciona o comando daemon."""
+    daemon_parser = subparsers.add_parser(
+        'daemon',
+        help='Executa como daemon (serviço em background)'
+    )
+    daemon_parser.add_argument(
+        '--log-level',
+        choices=['debug', 'info', 'warning', 'error'],
+        default='info',
+        help='Nível de log para o daemon'
+    )
+
+
+def _build_status_issue(subparsers):
+    """Adiciona o comando status-issue."""
+    status_parser = subparsers.add_parser(
+        'status-issue',
+        help='Gerencia status de issues no Jira'
+    )
+    status_parser.add_argument(
+        'issue_key',
+        help='Chave da issue (ex: PROJ-123)'
+    )
+    status_parser.add_argument(
+        'new_status',
+        help='Novo status da issue'
+    )
+    status_parser.add_argument(
+        '--comment',
+        help='Comentário opcional para a transição'
+    )
+
+
+def _build_automation(subparsers):
+    """Adiciona o comando automation."""
+    automation_parser = subparsers.add_parser(
+        'automation',
+        help='Gerencia automação de status de issues'
+    )
+    automation_subparsers = automation_parser.add_subparsers(dest='automation_action', help='Ações de automação')
+
+    # Subcomando show
+    automation_subparsers.add_parser(
+        'show',
+        help='Mostra regras de automação atuais'
+    )
+
+    # Subcomando enable
+    enable_parser = automation_subparsers.add_parser(
+        'enable',
+        help='Habilita automação de status'
+    )
+    enable_parser.add_argument(
+        'rule_name',
+        nargs='?',
+        choices=['on_work_start', 'on_first_commit', 'on_work_complete'],
+        help='Nome da regra específica para habilitar'
+    )
+
+    # Subcomando disable
+    disable_parser = automation_subparsers.add_parser(
+        'disable',
+        help='Desabilita automação de status'
+    )
+    disable_parser.add_argument(
+        'rule_name',
+        nargs='?',
+        choices=['on_work_start', 'on_first_commit', 'on_work_complete'],
+        help='Nome da regra específica para desabilitar'
+    )
+
+    # Subcomando reset
+    automation_subparsers.add_parser(
+        'reset',
+        help='Reseta regras para os padrões'
+    )
+
+    # Subcomando auto-revert
+    revert_parser = automation_subparsers.add_parser(
+        'auto-revert',
+        help='Configura reversão automática de status'
+    )
+    revert_parser.add_argument(
+        'action',
+        choices=['enable', 'disable', 'status'],
+        help='Ação: enable (habilitar), disable (desabilitar), status (mostrar status)'
+    )
+
+    # Subcomando configure
+    configure_parser = automation_subparsers.add_parser(
+        'configure',
+        help='Configura regras baseadas no seu Jira'
+    )
+    configure_parser.add_argument(
+        '--project',
+        help='Chave do projeto para descobrir status (ex: PROJ)'
+    )
+    configure_parser.add_argument(
+        '--issue',
+        help='Issue exemplo para descobrir workflow (ex: PROJ-123)'
+    )
+    configure_parser.add_argument(
+        '--apply',
+        action='store_true',
+        help='Aplica automaticamente a configuração sugerida'
+    )
+
+
+def _build_jira_status(subparsers):
+    """Adiciona o comando jira-status."""
+    jira_status_parser = subparsers.add_parser(
+        'jira-status',
+        help='Descobre status e workflows do Jira'
+    )
+    jira_status_subparsers = jira_status_parser.add_subparsers(dest='jira_status_action', help='Ações de status')
+
+    # Subcomando projects
+    jira_status_subparsers.add_parser(
+        'projects',
+        help='Lista projetos acessíveis'
+    )
+
+    # Subcomando list
+    list_status_parser = jira_status_subparsers.add_parser(
+        'list',
+        help='Lista status de um projeto'
+    )
+    list_status_parser.add_argument(
+        'project_key',
+        help='Chave do projeto (ex: PROJ)'
+    )
+
+    # Subcomando workflow
+    workflow_parser = jira_status_subparsers.add_parser(
+        'workflow',
+        help='Mostra workflow de uma issue'
+    )
+    workflow_parser.add_argument(
+        'issue_key',
+        help='Chave da issue (ex: PROJ-123)'
+    )
+
+
+# Comando -> função que adiciona seu subparser, na ordem exibida na ajuda
+_SUBCOMMAND_BUILDERS: Dict[str, Callable] = {
+    'start': _build_start,
+    'stop': _build_stop,
+    'add': _build_add,
+    'status': _build_status,
+    'list': _build_list,
+    'orphans': _build_orphans,
+    'config': _build_config,
+    'interactive': _build_interactive,
+    'docs': _build_docs,
+    'stats': _build_stats,
+    'logs': _build_logs,
+    'daemon': _build_daemon,
+    'status-issue': _build_status_issue,
+    'automation': _build_automation,
+    'jira-status': _build_jira_status,
+}
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Retorna o primeiro argumento que não é opção (o comando), se houver.
+
+    Um -h/--help antes do comando pede a ajuda geral, então não há comando.
+    """
+    for arg in argv:
+        if arg in ('-h', '--help'):
+            return None
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+
+def _read_help_text(file_name: str) -> str:
+    """Lê um texto de ajuda guardado ao lado deste módulo."""
+    return (Path(__file__).parent / file_name).read_text(encoding='utf-8')
+
+
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Cria o parser de argumentos.
+
+    Só o subparser do comando invocado é montado; sem comando conhecido
+    (ex: --help ou erro de digitação), todos são montados.
+    """
+    command = _sniff_subcommand(sys.argv[1:] if argv is None else argv)
+    return _build_parser(command if command in _SUBCOMMAND_BUILDERS else None)
+
+
+# O parser só depende do comando; parse_args não o altera, então cada variação
+# é montada uma única vez por processo
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """Monta o parser com o subparser de `command`, ou com todos se for None."""
+    # A descrição e os exemplos só aparecem na ajuda geral; com um comando
+    # conhecido, o parser principal nunca os exibe e os arquivos não são lidos
+    if command is not None:
+        description = epilog = None
+    else:
+        description = _read_help_text('help_description.txt')
+        epilog = _read_help_text('help_epilog.txt')
+
+    parser = argparse.ArgumentParser(
+        prog='dev-peace',
+        description=description,
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    subparsers = parser.add_subparsers(dest='command', help='Comandos disponíveis')
+
+    if command is not None:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
+
+    return parser
@@ -22,6 +22,8 @@ class ConfigManager:
         
         self.config_file = config_file
         self._config: Dict[str, Any] = {}
+        # Incrementado a cada alteração salva; permite cachear visões da configuração
+        self.version = 0
         self._load_config()
     
     def _load_config(self):
@@ -41,6 +43,7 @@ class ConfigManager:
     
     def _save_config(self):
         """Salva configurações no arquivo."""
+        self.version += 1
         try:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
             with open(self.config_file, 'w', encoding='utf-8') as f:
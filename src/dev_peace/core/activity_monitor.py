@@ -4,20 +4,31 @@ Monitor principal de atividades de desenvolvimento.
 """
 
 import logging
+import threading
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import TYPE_CHECKING, Any, Optional, Dict, List
 from watchdog.observers import Observer
 
 from ..database.models import DatabaseManager, Repository, WorkSession
 from ..git_monitor.detector import GitActivityMonitor, GitRepositoryDetector
 from ..git_monitor.branch_parser import JiraBranchParser
-from ..jira_integration.client import JiraClient
 from ..config.settings import ConfigManager
 from .status_manager import StatusManager
 
+if TYPE_CHECKING:
+    from ..jira_integration.client import JiraClient
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StatusSnapshot:
+    """Estatísticas e sessões ativas lidas de uma só vez, para a tela de status."""
+    stats: Dict[str, Any]
+    active_sessions: List[WorkSession]
+
+
 class DevPeaceActivityMonitor:
     """Monitor principal que coordena todas as atividades do Dev Peace."""
     
@@ -28,6 +39,9 @@ class DevPeaceActivityMonitor:
         self.active_sessions: Dict[str, int] = {}  # repo_path -> session_id
         self.monitored_paths: List[str] = []
         self.is_running = False
+        # Sinalizado quando o monitor não está rodando, para esperar sem polling
+        self._stopped = threading.Event()
+        self._stopped.set()
         self.first_commits: Dict[str, bool] = {}  # session_id -> has_first_commit
 
         # Inicializa cliente Jira se configurado
@@ -44,12 +58,15 @@ class DevPeaceActivityMonitor:
             on_branch_changed=self._handle_branch_change
         )
 
-    def _init_jira_client(self) -> Optional[JiraClient]:
+    def _init_jira_client(self) -> Optional["JiraClient"]:
         """Inicializa cliente Jira se configurado."""
         jira_config = self.config.get_jira_config()
         if not all(jira_config.values()):
             return None
 
+        # Importado aqui: a biblioteca jira só é carregada quando há credenciais
+        from ..jira_integration.client import JiraClient
+
         try:
             client = JiraClient(jira_config['url'], jira_config['user'], jira_config['token'])
             if client.connect():
@@ -114,6 +131,7 @@ class DevPeaceActivityMonitor:
         self.observer.start()
 
         self.is_running = True
+        self._stopped.clear()
         logger.info("Monitor de atividades iniciado")
     
     def stop_monitoring(self):
@@ -132,9 +150,14 @@ class DevPeaceActivityMonitor:
         self.is_running = False
         self.active_sessions.clear()
         self.monitored_paths.clear()
+        self._stopped.set()
 
         logger.info("Monitor de atividades parado")
 
+    def wait_until_stopped(self, timeout: Optional[float] = None) -> bool:
+        """Bloqueia até o monitor parar (ou o timeout); retorna se ele parou."""
+        return self._stopped.wait(timeout)
+
     def refresh_repositories(self):
         """Atualiza a lista de repositórios monitorados a partir do banco de dados."""
         if not self.is_running:
@@ -452,14 +475,7 @@ class DevPeaceActivityMonitor:
     
     def get_active_sessions(self) -> List[WorkSession]:
         """Retorna todas as sessões ativas."""
-        active_sessions = []
-        for repo_path, session_id in self.active_sessions.items():
-            repository = self.db.get_repository_by_path(repo_path)
-            if repository:
-                session = self.db.get_active_session_for_repo(repository.id)
-                if session:
-                    active_sessions.append(session)
-        return active_sessions
+        return self.get_status_snapshot().active_sessions
     
     def force_end_session(self, repo_path: str) -> bool:
         """Força o fim de uma sessão específica."""
@@ -470,18 +486,20 @@ class DevPeaceActivityMonitor:
             return True
         return False
     
-    def get_repository_stats(self) -> Dict[str, any]:
+    def get_repository_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas dos repositórios monitorados."""
-        repositories = self.db.get_all_repositories()
-        orphan_records = self.db.get_orphan_records()
-        
-        return {
-            'total_repositories': len(repositories),
-            'active_repositories': len([r for r in repositories if r.is_active]),
+        return self.get_status_snapshot().stats
+
+    def get_status_snapshot(self) -> StatusSnapshot:
+        """Retorna estatísticas e sessões ativas com uma única ida ao banco."""
+        counts, active_sessions = self.db.get_status_summary(list(self.active_sessions.values()))
+
+        stats = {
+            **counts,
             'active_sessions': len(self.active_sessions),
-            'orphan_records': len(orphan_records),
             'monitored_paths': len(self.monitored_paths),
             'is_running': self.is_running
         }
+        return StatusSnapshot(stats, active_sessions)
 
 
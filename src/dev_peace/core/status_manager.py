@@ -2,23 +2,43 @@
 Gerenciador de status automático de issues do Jira.
 """
 
+import copy
 import logging
-from typing import Dict, List, Optional, Any
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any
 from datetime import datetime
 
 from ..config.settings import ConfigManager
-from ..jira_integration.client import JiraClient
+
+if TYPE_CHECKING:
+    from ..jira_integration.client import JiraClient
 
 logger = logging.getLogger(__name__)
 
+# Eventos que disparam transições de status
+EVENTS = ('on_work_start', 'on_first_commit', 'on_work_complete')
+
+# Título de exibição de cada evento ("on_work_start" -> "Work Start")
+EVENT_TITLES = {event_name: event_name.removeprefix('on_').replace('_', ' ').title() for event_name in EVENTS}
+
+
+def event_title(event_name: str) -> str:
+    """Retorna o título de exibição do evento (também para eventos desconhecidos)."""
+    title = EVENT_TITLES.get(event_name)
+    if title is None:
+        title = event_name.removeprefix('on_').replace('_', ' ').title()
+    return title
+
 
 class StatusManager:
     """Gerenciador de mudanças automáticas de status no Jira."""
     
-    def __init__(self, config: ConfigManager, jira_client: Optional[JiraClient] = None):
+    def __init__(self, config: ConfigManager, jira_client: Optional["JiraClient"] = None):
         self.config = config
         self.jira_client = jira_client
         self.status_rules = self._load_status_rules()
+        # Cópia em edição pelo bloco `mutate_rules` mais externo, se houver um aberto
+        self._pending_rules: Optional[Dict[str, Any]] = None
 
     def _load_status_rules(self) -> Dict[str, Any]:
         """Carrega regras de mudança de status da configuração."""
@@ -36,6 +56,30 @@ class StatusManager:
         """Salva regras de mudança de status na configuração."""
         self.config.set_setting('status_automation', rules)
         self.status_rules = rules
+
+    @contextmanager
+    def mutate_rules(self) -> Iterator[Dict[str, Any]]:
+        """Entrega uma cópia das regras para alteração no bloco `with` e salva ao sair, se algo mudou."""
+        if self._pending_rules is not None:
+            # Bloco aninhado: altera a mesma cópia, salva uma única vez pelo bloco externo
+            yield self._pending_rules
+            return
+
+        # Cópia profunda: listas e regras internas não ficam compartilhadas com as
+        # regras atuais (nem com a configuração carregada) até o salvamento
+        rules = copy.deepcopy(self.status_rules)
+        events = rules.setdefault('events', {})
+        for event_name in EVENTS:
+            events.setdefault(event_name, [])
+
+        self._pending_rules = rules
+        try:
+            yield rules
+        finally:
+            self._pending_rules = None
+        # Só chega aqui se o bloco terminou sem exceção; em caso de erro nada é alterado
+        if rules != self.status_rules:
+            self.save_status_rules(rules)
     
     def is_enabled(self) -> bool:
         """Verifica se a automação de status está habilitada."""
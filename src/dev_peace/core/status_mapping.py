@@ -0,0 +1,140 @@
+"""
+Mapeamento automático de status do Jira para as categorias da automação.
+"""
+
+import difflib
+import re
+import unicodedata
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Pattern, Tuple
+
+# Nomes conhecidos de cada categoria (incluindo variações em português), somente leitura
+_STATUS_NAMES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'todo': (
+        'To Do', 'TODO', 'Backlog', 'New', 'Open', 'Created',
+        'A FAZER', 'FILA', 'Na fila', 'Fila de', 'DEMANDAS'
+    ),
+    'in_progress': (
+        'In Progress', 'IN PROGRESS', 'Em Progresso', 'Doing', 'Development',
+        'FAZENDO', 'Trabalhando', 'Implementando', 'CRIANDO', 'EDITANDO',
+        'Editando', 'Criando', 'GRAVANDO', 'Gravando', 'Analisando', 'ANALISANDO'
+    ),
+    'done': (
+        'Done', 'DONE', 'Closed', 'Resolved', 'Finalizado', 'Complete',
+        'FEITO', 'FINALIZADO', 'Concluído', 'Resolvido', 'Implementado'
+    )
+})
+
+# Similaridade mínima (0 a 1) para aceitar um status parecido com um sinônimo
+MATCH_CUTOFF = 0.85
+
+# Fração mínima de um sinônimo que um status contido nele precisa cobrir;
+# evita que status curtos como "do" ou "in" casem com "to do" ou "in progress"
+MIN_CONTAINED_SHARE = 0.5
+
+
+def normalize_status(name: str) -> str:
+    """Remove acentos, espaços extras e caixa para comparar nomes de status."""
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return ascii_name.lower().strip()
+
+
+# Sinônimos já normalizados, calculados uma única vez na importação; somente leitura,
+# pois os índices abaixo e os mapeamentos salvos dependem deles
+STATUS_SYNONYMS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    category: frozenset(normalize_status(name) for name in names)
+    for category, names in _STATUS_NAMES.items()
+})
+
+
+def _compact(status_norm: str) -> str:
+    """Remove tudo que não é letra ou número ("To Do" e "TODO" viram "todo")."""
+    return re.sub(r'[^a-z0-9]', '', status_norm)
+
+
+# Índice reverso sinônimo compacto -> categoria, para casamentos exatos em O(1)
+_SYNONYM_INDEX: Dict[str, str] = {
+    _compact(synonym): category
+    for category, synonyms in STATUS_SYNONYMS.items()
+    for synonym in synonyms
+}
+
+# Sinônimo normalizado -> categoria, em ordem estável
+_SYNONYM_CATEGORY: Dict[str, str] = {
+    synonym: category
+    for category, synonyms in STATUS_SYNONYMS.items()
+    for synonym in sorted(synonyms)
+}
+
+# Qualquer sinônimo como palavra inteira, numa única regex (mais longos primeiro);
+# casa "fila de" em "na fila de qa", mas não "open" em "reopened"
+_SYNONYM_RE: Pattern = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(_SYNONYM_CATEGORY, key=len, reverse=True))) + r')\b'
+)
+
+
+def _may_beat(upper_bound: float, best_score: float) -> bool:
+    """Indica se uma similaridade de até `upper_bound` ainda pode ser aceita e superar a melhor."""
+    return upper_bound >= MATCH_CUTOFF and upper_bound > best_score
+
+
+def _best_category(status_norm: str) -> Tuple[float, Optional[str]]:
+    """Retorna (pontuação, categoria) do sinônimo mais parecido com o status normalizado."""
+    match = _SYNONYM_RE.search(status_norm)
+    if match:
+        return 1.0, _SYNONYM_CATEGORY[match.group()]
+
+    # O status inteiro contido num sinônimo ("fila" em "na fila")
+    min_synonym_len = len(status_norm) / MIN_CONTAINED_SHARE
+    status_re = re.compile(rf'\b{re.escape(status_norm)}\b')
+    for synonym, category in _SYNONYM_CATEGORY.items():
+        if len(synonym) <= min_synonym_len and status_re.search(synonym):
+            return 1.0, category
+
+    # Ou um nome parecido; abaixo de MATCH_CUTOFF o resultado é descartado, então os
+    # limites superiores baratos (tamanho, depois caracteres) pulam o cálculo completo
+    best_score, best_category = 0.0, None
+    matcher = difflib.SequenceMatcher(None, b=status_norm)
+    for synonym, category in _SYNONYM_CATEGORY.items():
+        matcher.set_seq1(synonym)
+        if not _may_beat(matcher.real_quick_ratio(), best_score) or not _may_beat(matcher.quick_ratio(), best_score):
+            continue
+        score = matcher.ratio()
+        if score > best_score:
+            best_score, best_category = score, category
+    return best_score, best_category
+
+
+def map_statuses(available_statuses: Iterable[str]) -> Dict[str, str]:
+    """Associa cada categoria ao primeiro status disponível parecido com um de seus sinônimos."""
+    found_statuses = {}
+    unmatched = []
+    for status in available_statuses:
+        status_norm = normalize_status(status)
+        if not status_norm:
+            continue
+
+        category = _SYNONYM_INDEX.get(_compact(status_norm))
+        if category is None:
+            unmatched.append((status, status_norm))
+            continue
+
+        found_statuses.setdefault(category, status)
+        # Demais status não mudariam o resultado
+        if len(found_statuses) == len(STATUS_SYNONYMS):
+            return _in_category_order(found_statuses)
+
+    # Comparação aproximada só para os status sem casamento exato
+    for status, status_norm in unmatched:
+        score, category = _best_category(status_norm)
+        if score >= MATCH_CUTOFF:
+            found_statuses.setdefault(category, status)
+            if len(found_statuses) == len(STATUS_SYNONYMS):
+                break
+
+    return _in_category_order(found_statuses)
+
+
+def _in_category_order(found_statuses: Dict[str, str]) -> Dict[str, str]:
+    """Reordena o resultado na ordem das categorias, para exibição."""
+    return {category: found_statuses[category] for category in STATUS_SYNONYMS if category in found_statuses}
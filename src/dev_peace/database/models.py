@@ -6,12 +6,15 @@ import sqlite3
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from dataclasses import dataclass
 import os
 
 logger = logging.getLogger(__name__)
 
+# UPDATE ... RETURNING só existe a partir do SQLite 3.35
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 @dataclass
 class Repository:
@@ -313,26 +316,55 @@ class DatabaseManager:
             ).fetchone()
 
             if row:
-                return WorkSession(
-                    id=row['id'],
-                    repository_id=row['repository_id'],
-                    branch_name=row['branch_name'],
-                    jira_issue=row['jira_issue'],
-                    start_time=datetime.fromisoformat(row['start_time']) if row['start_time'] else None,
-                    end_time=datetime.fromisoformat(row['end_time']) if row['end_time'] else None,
-                    total_minutes=row['total_minutes'],
-                    is_active=bool(row['is_active']),
-                    jira_worklog_id=row['jira_worklog_id'],
-                    status=row['status'],
-                    original_jira_status=(
-                        row['original_jira_status'] if 'original_jira_status' in row.keys() else None
-                    ),
-                    current_jira_status=(
-                        row['current_jira_status'] if 'current_jira_status' in row.keys() else None
-                    )
-                )
+                return self._row_to_work_session(row)
             return None
 
+    @staticmethod
+    def _row_to_work_session(row: sqlite3.Row) -> WorkSession:
+        """Converte uma linha de work_sessions em WorkSession."""
+        return WorkSession(
+            id=row['id'],
+            repository_id=row['repository_id'],
+            branch_name=row['branch_name'],
+            jira_issue=row['jira_issue'],
+            start_time=datetime.fromisoformat(row['start_time']) if row['start_time'] else None,
+            end_time=datetime.fromisoformat(row['end_time']) if row['end_time'] else None,
+            total_minutes=row['total_minutes'],
+            is_active=bool(row['is_active']),
+            jira_worklog_id=row['jira_worklog_id'],
+            status=row['status'],
+            original_jira_status=(
+                row['original_jira_status'] if 'original_jira_status' in row.keys() else None
+            ),
+            current_jira_status=(
+                row['current_jira_status'] if 'current_jira_status' in row.keys() else None
+            )
+        )
+
+    def get_status_summary(self, session_ids: Sequence[int]) -> Tuple[Dict[str, int], List[WorkSession]]:
+        """Retorna as contagens de repositórios/órfãos e as sessões ativas informadas, numa única conexão."""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                """SELECT COUNT(*) AS total_repositories,
+                          COALESCE(SUM(is_active), 0) AS active_repositories,
+                          (SELECT COUNT(*) FROM orphan_records WHERE status = 'orphaned') AS orphan_records
+                   FROM repositories"""
+            ).fetchone()
+            counts = dict(row)
+
+            sessions = []
+            if session_ids:
+                placeholders = ", ".join("?" * len(session_ids))
+                rows = conn.execute(
+                    f"""SELECT * FROM work_sessions
+                        WHERE id IN ({placeholders}) AND is_active = 1
+                        ORDER BY start_time""",
+                    tuple(session_ids)
+                ).fetchall()
+                sessions = [self._row_to_work_session(session_row) for session_row in rows]
+
+            return counts, sessions
+
     def create_orphan_record(self, session_id: int, branch_name: str) -> int:
         """Cria um registro órfão."""
         with self.get_connection() as conn:
@@ -375,26 +407,25 @@ class DatabaseManager:
                 for row in rows
             ]
 
-    def toggle_repository_status(self, repository_id: int) -> bool:
-        """Ativa/desativa um repositório."""
+    def toggle_repository_status(self, repository_id: int) -> Optional[bool]:
+        """Ativa/desativa um repositório e retorna o novo status (None se não existir)."""
         with self.get_connection() as conn:
-            # Busca status atual
-            current_status = conn.execute(
-                "SELECT is_active FROM repositories WHERE id = ?", (repository_id,)
-            ).fetchone()
-
-            if not current_status:
-                return False
-
-            # Inverte o status
-            new_status = not bool(current_status['is_active'])
-
-            conn.execute(
-                "UPDATE repositories SET is_active = ? WHERE id = ?",
-                (new_status, repository_id)
-            )
+            if _SQLITE_HAS_RETURNING:
+                # Inverte o status e lê o resultado na mesma consulta
+                row = conn.execute(
+                    "UPDATE repositories SET is_active = NOT is_active WHERE id = ? RETURNING is_active",
+                    (repository_id,)
+                ).fetchone()
+            else:
+                conn.execute(
+                    "UPDATE repositories SET is_active = NOT is_active WHERE id = ?",
+                    (repository_id,)
+                )
+                row = conn.execute(
+                    "SELECT is_active FROM repositories WHERE id = ?", (repository_id,)
+                ).fetchone()
             conn.commit()
-            return True
+            return bool(row['is_active']) if row else None
 
     def get_repository_by_id(self, repository_id: int) -> Optional[Repository]:
         """Busca repositório por ID."""
@@ -434,6 +465,14 @@ class DatabaseManager:
                 for row in rows
             ]
 
+    def get_orphan_records_signature(self) -> tuple:
+        """Retorna (quantidade, maior id) dos órfãos pendentes, para detectar mudanças."""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*), MAX(id) FROM orphan_records WHERE status = 'orphaned'"
+            ).fetchone()
+            return tuple(row)
+
     def assign_orphan_issue(self, orphan_id: int, jira_issue: str) -> bool:
         """Associa uma issue do Jira a um registro órfão."""
         with self.get_connection() as conn:
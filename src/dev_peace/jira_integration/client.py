@@ -2,14 +2,43 @@
 Cliente para integração com Jira.
 """
 
+import functools
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from jira import JIRA
 from jira.exceptions import JIRAError
 
 logger = logging.getLogger(__name__)
 
+# Tempo (em segundos) que respostas de metadados do Jira ficam em cache
+PROJECTS_CACHE_TTL = 300
+STATUSES_CACHE_TTL = 600
+
+# Campos pedidos nas buscas de issues: só os usados no resultado, em vez de todos
+SEARCH_FIELDS = 'summary,status,assignee,project'
+
+
+def _ttl_cache(ttl: float):
+    """Reaproveita respostas não vazias do método por `ttl` segundos, por cliente e argumentos."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            key = (method.__name__, *args)
+            now = time.monotonic()
+            cached = self._cache.get(key)
+            if cached and now - cached[0] < ttl:
+                return cached[1]
+
+            value = method(self, *args)
+            # Falhas devolvem lista/dict vazio e não devem ficar em cache
+            if value:
+                self._cache[key] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
 
 class JiraClient:
     """Cliente para interação com Jira."""
@@ -20,14 +49,18 @@ class JiraClient:
         self.api_token = api_token
         self._client: Optional[JIRA] = None
         self._authenticated = False
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
     
     def connect(self) -> bool:
         """Conecta ao Jira e autentica."""
+        self.clear_cache()
         try:
-            self._client = JIRA(
-                server=self.server_url,
-                basic_auth=(self.username, self.api_token)
-            )
+            # Reconexões reaproveitam a sessão HTTP (keep-alive) do cliente já criado
+            if self._client is None:
+                self._client = JIRA(
+                    server=self.server_url,
+                    basic_auth=(self.username, self.api_token)
+                )
             
             # Testa a conexão
             self._client.myself()
@@ -47,6 +80,15 @@ class JiraClient:
     def is_connected(self) -> bool:
         """Verifica se está conectado ao Jira."""
         return self._authenticated and self._client is not None
+
+    def clear_cache(self):
+        """Descarta projetos e status guardados em cache."""
+        self._cache.clear()
+
+    def warm_cache(self):
+        """Pré-carrega projetos e status no cache (útil em segundo plano)."""
+        self.get_projects()
+        self.get_all_statuses()
     
     def get_issue(self, issue_key: str) -> Optional[Dict[str, Any]]:
         """Busca uma issue do Jira."""
@@ -157,13 +199,18 @@ class JiraClient:
     
     def search_issues(self, jql: str, max_results: int = 50) -> List[Dict[str, Any]]:
         """Busca issues usando JQL."""
+        return self.search_issues_with_total(jql, max_results=max_results)[1]
+
+    def search_issues_with_total(self, jql: str,
+                                 max_results: int = 50) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        """Busca issues usando JQL; retorna também o total que atende à busca (None se desconhecido ou em erro)."""
         if not self.is_connected():
             logger.error("Cliente Jira não está conectado")
-            return []
+            return None, []
         
         try:
-            issues = self._client.search_issues(jql, maxResults=max_results)
-            return [
+            issues = self._client.search_issues(jql, maxResults=max_results, fields=SEARCH_FIELDS)
+            return getattr(issues, 'total', None), [
                 {
                     'key': issue.key,
                     'summary': issue.fields.summary,
@@ -175,13 +222,19 @@ class JiraClient:
             ]
         except JIRAError as e:
             logger.error(f"Erro ao buscar issues com JQL '{jql}': {e}")
-            return []
+            return None, []
         except Exception as e:
             logger.error(f"Erro inesperado ao buscar issues: {e}")
-            return []
+            return None, []
     
-    def get_my_issues(self, status_filter: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Busca issues atribuídas ao usuário atual."""
+    def get_my_issues(self, status_filter: Optional[str] = None,
+                      max_results: int = 50) -> List[Dict[str, Any]]:
+        """Busca issues atribuídas ao usuário atual (no máximo `max_results`)."""
+        return self.get_my_issues_with_total(status_filter, max_results=max_results)[1]
+
+    def get_my_issues_with_total(self, status_filter: Optional[str] = None,
+                                 max_results: int = 50) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        """Busca issues atribuídas ao usuário atual e o total delas, numa única consulta."""
         jql = f"assignee = currentUser()"
         
         if status_filter:
@@ -189,7 +242,7 @@ class JiraClient:
         
         jql += " ORDER BY updated DESC"
         
-        return self.search_issues(jql)
+        return self.search_issues_with_total(jql, max_results=max_results)
 
     def transition_issue(self, issue_key: str, new_status: str) -> bool:
         """Faz transição de status de uma issue."""
@@ -280,20 +333,17 @@ class JiraClient:
             logger.error("Cliente Jira não está conectado")
             return []
 
-        try:
-            # Na versão 3.10.x da lib jira, usamos o método statuses() global
-            # Se quisermos filtrar por projeto, precisaríamos de transições de issues reais,
-            # mas por simplicidade e robustez, vamos retornar os status globais que 
-            # costumam cobrir o que o usuário precisa.
-            all_statuses = self._client.statuses()
-            return sorted(list(set(s.name for s in all_statuses)))
-
-        except Exception as e:
-            logger.error(f"Erro ao buscar status do Jira: {e}")
-            return []
+        # Na versão 3.10.x da lib jira, usamos o método statuses() global
+        # Se quisermos filtrar por projeto, precisaríamos de transições de issues reais,
+        # mas por simplicidade e robustez, vamos retornar os status globais que 
+        # costumam cobrir o que o usuário precisa.
+        # Como a resposta não depende do projeto, todos compartilham a mesma
+        # entrada em cache: uma única chamada atende qualquer número de projetos.
+        return self.get_all_statuses()
 
     def get_issue_workflow_statuses(self, issue_key: str) -> Dict[str, Any]:
         """Obtém informações completas do workflow de uma issue específica."""
+        # Sem cache: o status atual e as transições mudam fora do Dev Peace
         if not self.is_connected():
             logger.error("Cliente Jira não está conectado")
             return {}
@@ -329,6 +379,7 @@ class JiraClient:
             logger.error(f"Erro inesperado ao buscar workflow: {e}")
             return {}
 
+    @_ttl_cache(PROJECTS_CACHE_TTL)
     def get_projects(self) -> List[Dict[str, Any]]:
         """Lista todos os projetos acessíveis."""
         if not self.is_connected():
@@ -353,6 +404,7 @@ class JiraClient:
             logger.error(f"Erro inesperado ao buscar projetos: {e}")
             return []
 
+    @_ttl_cache(STATUSES_CACHE_TTL)
     def get_all_statuses(self) -> List[str]:
         """Obtém todos os nomes de status únicos disponíveis no servidor Jira."""
         if not self.is_connected():